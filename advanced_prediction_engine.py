@@ -9,7 +9,6 @@ This engine combines multiple prediction models for maximum accuracy:
 - Historical Performance Tracking
 """
 
-import requests
 import logging
 import statistics
 import math
@@ -2,9 +2,10 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode
 from datetime import datetime
+import asyncio
 import logging
-import requests
 import os
+from bot_singletons import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +13,7 @@ class BotHandlers:
     def __init__(self):
         self.odds_api_key = os.getenv('ODDS_API_KEY')
         self.api_base_url = "https://api.the-odds-api.com/v4"
+        self.session = get_session()
         
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
@@ -92,7 +94,7 @@ americanfootball_nfl, basketball_nba, soccer_epl, baseball_mlb, icehockey_nhl, t
                 'dateFormat': 'iso'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(self.session.get, url, params=params, timeout=10)
             
             if response.status_code != 200:
                 await update.message.reply_text("Unable to fetch current odds data. Please try again later.")
@@ -170,7 +172,7 @@ americanfootball_nfl, basketball_nba, soccer_epl, baseball_mlb, icehockey_nhl, t
                 'dateFormat': 'iso'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(self.session.get, url, params=params, timeout=10)
             
             if response.status_code == 200:
                 games = response.json()
@@ -319,7 +321,7 @@ Rapid line movement indicating sharp money action from professional bettors.
                 'dateFormat': 'iso'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(self.session.get, url, params=params, timeout=10)
             
             if response.status_code == 200:
                 games = response.json()
@@ -387,7 +389,7 @@ Rapid line movement indicating sharp money action from professional bettors.
                 'dateFormat': 'iso'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(self.session.get, url, params=params, timeout=10)
             
             if response.status_code != 200:
                 await update.message.reply_text(f"Unable to fetch odds for {sport}. Check sport key or try again.")
@@ -537,7 +539,7 @@ Edge% = (Win Probability × Decimal Odds) - 1
                         'dateFormat': 'iso'
                     }
                     
-                    response = requests.get(url, params=params, timeout=10)
+                    response = await asyncio.to_thread(self.session.get, url, params=params, timeout=10)
                     
                     if response.status_code == 200:
                         games = response.json()
@@ -610,7 +612,7 @@ Edge% = (Win Probability × Decimal Odds) - 1
                             'dateFormat': 'iso'
                         }
                         
-                        response = requests.get(url, params=params, timeout=10)
+                        response = await asyncio.to_thread(self.session.get, url, params=params, timeout=10)
                         
                         if response.status_code == 200:
                             games = response.json()
@@ -679,7 +681,7 @@ Edge% = (Win Probability × Decimal Odds) - 1
                         'dateFormat': 'iso'
                     }
                     
-                    response = requests.get(url, params=params, timeout=10)
+                    response = await asyncio.to_thread(self.session.get, url, params=params, timeout=10)
                     
                     if response.status_code == 200:
                         games = response.json()
@@ -939,7 +941,7 @@ Scanning opportunities across major sports...
                 'dateFormat': 'iso'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(self.session.get, url, params=params, timeout=10)
             
             if response.status_code == 200:
                 scores = response.json()
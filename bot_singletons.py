@@ -0,0 +1,58 @@
+"""
+Process-wide shared objects for the Telegram bot
+
+A single BotHandlers instance and a single pooled HTTP session are reused by
+every entrypoint, so handlers and the odds API client are built once per dyno.
+The analysis engines of concurrent sport scans share one thread pool.
+"""
+
+import functools
+import threading
+
+_engine_executor = None
+_engine_executor_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def get_session():
+    """Shared keep-alive HTTP session for all odds API calls"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    # Exhausted status retries hand back the last response so callers' status checks still run
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                    raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@functools.lru_cache(maxsize=1)
+def get_handlers():
+    """Shared BotHandlers instance"""
+    from bot_handlers import BotHandlers
+    return BotHandlers()
+
+def close_session():
+    """Close the shared HTTP session if it was ever created"""
+    if get_session.cache_info().currsize:
+        get_session().close()
+        get_session.cache_clear()
+
+def get_engine_executor(max_workers: int):
+    """Shared thread pool for analysis engine calls, sized by its first caller"""
+    global _engine_executor
+    with _engine_executor_lock:
+        if _engine_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _engine_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sport-engines")
+        return _engine_executor
+
+def shutdown_engine_executor():
+    """Stop the shared engine pool if it was ever created, dropping queued calls"""
+    global _engine_executor
+    with _engine_executor_lock:
+        executor, _engine_executor = _engine_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -33,4 +33,10 @@ MARKETS = [
 
 # Rate limiting
 API_CALL_DELAY = 1  # seconds between API calls
+ODDS_CACHE_TTL = 30  # seconds an identical API response is reused
+
+# Consensus snapshots for line-movement tracking. Heroku dynos have an
+# ephemeral filesystem, so this history only survives until the next restart
+# unless ODDS_HISTORY_DB points at persistent storage.
+ODDS_HISTORY_DB = os.getenv("ODDS_HISTORY_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "odds_history.db"))
 MAX_GAMES_PER_REQUEST = 10
@@ -28,9 +28,10 @@ class HorseRacingAdvantageSystem:
             multi_outcome_sports = ['baseball_mlb', 'basketball_nba', 'soccer_epl']
             all_advantages = []
             
-            for sport_key in multi_outcome_sports:
+            games_by_sport = self.odds_service.get_odds_batch(multi_outcome_sports)
+            
+            for sport_key, games in games_by_sport.items():
                 try:
-                    games = self.odds_service.get_odds(sport_key)
                     if not games:
                         continue
                     
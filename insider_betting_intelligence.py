@@ -10,17 +10,86 @@ Advanced market analysis that mimics institutional betting intelligence:
 - Market maker identification and following
 """
 
+import bisect
+import heapq
 import logging
-from typing import Dict, List, Optional
+import operator
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
+from dataclasses import dataclass
 from odds_service import OddsService
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class MarketStats:
+    low: float = 0.0
+    high: float = 0.0
+    spread: float = 0.0  # high - low
+    mean: float = 0.0
+    variance: float = 0.0
+
+@dataclass(slots=True)
+class InsiderOpportunity:
+    game: Dict
+    opportunity_score: int
+    market_analysis: Dict
+    professional_patterns: Dict
+    situational_factors: Dict
+    line_movement: Dict
+
+# Opportunity score weights, scaled by 100 so scoring stays in integer arithmetic
+EFFICIENCY_WEIGHT = 200  # two points per efficiency step
+PATTERN_WEIGHT = 40
+SITUATIONAL_WEIGHT = 25
+MOVEMENT_WEIGHT = 15
+PROFESSIONAL_MONEY_BONUS = 1000
+
+# Opportunities are reported when their score is above this cutoff. The score
+# is the weighted sum // 100, so the weighted sum must reach the next whole
+# point (scaled by 100) to clear it.
+OPPORTUNITY_SCORE_CUTOFF = 70
+MIN_WEIGHTED_OPPORTUNITY_SCORE = (OPPORTUNITY_SCORE_CUTOFF + 1) * 100
+
+def _score_opportunity(efficiency_score: Optional[int], pattern_strength: int,
+                       situational_score: int, movement_strength: int,
+                       professional_money: bool) -> int:
+    """Combine scalar analyzer outputs into the weighted opportunity score"""
+    base_score = 0
+    
+    # Market efficiency component (20% weight)
+    if efficiency_score is not None:
+        base_score += (10 - efficiency_score) * EFFICIENCY_WEIGHT  # Lower efficiency = higher opportunity
+    
+    # Professional patterns component (40% weight)
+    base_score += pattern_strength * PATTERN_WEIGHT
+    
+    # Situational factors component (25% weight)
+    base_score += situational_score * SITUATIONAL_WEIGHT
+    
+    # Line movement component (15% weight)
+    base_score += movement_strength * MOVEMENT_WEIGHT
+    if professional_money:
+        base_score += PROFESSIONAL_MONEY_BONUS  # Bonus for professional money
+    
+    return min(100, max(0, base_score // 100))
+
 class InsiderBettingIntelligence:
+    # Score thresholds and the label for each band below/between/above them
+    _SCORE_THRESHOLDS = (65, 75, 85)
+    _RECOMMENDATION_LABELS = ('MONITOR_ONLY', 'WEAK_PROFESSIONAL_SIGNAL',
+                              'MODERATE_SHARP_ACTION', 'STRONG_PROFESSIONAL_PLAY')
+    _CONFIDENCE_LABELS = ('LOW', 'MODERATE', 'HIGH', 'VERY_HIGH')
+    
     def __init__(self):
         self.odds_service = OddsService()
         self.historical_tracking = {}
+        self._analysis_cache: Dict[Tuple, Tuple[float, Optional[InsiderOpportunity]]] = {}
+        self._now_utc_cached: Optional[datetime] = None
+        self._analysis_lock = threading.Lock()
         
         # Professional betting situations that create edges
         self.high_value_situations = {
@@ -31,102 +100,231 @@ class InsiderBettingIntelligence:
             'travel_factors': ['back to back', 'cross country travel'],
             'weather_impact': ['rain', 'wind', 'cold weather']
         }
+        
+        # Sport-specific situational analysis, dispatched by sport key
+        self._situation_handlers = {
+            'americanfootball_nfl': self._analyze_football_situations,
+            'americanfootball_ncaaf': self._analyze_football_situations,
+            'basketball_nba': self._analyze_basketball_situations,
+            'basketball_ncaab': self._analyze_basketball_situations
+        }
+        
+        # Team-name keywords matched in a single regex scan per team
+        self.rivalry_keywords = ['division', 'conference']
+        self._rivalry_re = re.compile('|'.join(map(re.escape, self.rivalry_keywords)))
+        
+        # Sharp vs public bookmakers, classified by bookmaker key
+        self.sharp_bookmakers = frozenset({'pinnacle', 'betfair'})
+        self.public_bookmakers = frozenset({'draftkings', 'fanduel', 'betmgm'})
+        self._bm_class: Dict[str, str] = {}  # memoized classes of other bookmaker keys
+        
+        # Upper bounds of the weighted opportunity score components (scaled by
+        # 100), used to drop games that cannot clear the threshold early
+        self.max_pattern_component = 75 * PATTERN_WEIGHT  # divergence + reverse line + steam
+        self.max_movement_component = 100 * MOVEMENT_WEIGHT + PROFESSIONAL_MONEY_BONUS
     
     def analyze_professional_patterns(self, sport_key: str) -> List[Dict]:
         """Analyze professional betting patterns - Bot handler method"""
         return self.analyze_insider_opportunities(sport_key)
     
-    def analyze_insider_opportunities(self, sport_key: str) -> List[Dict]:
+    def analyze_insider_opportunities(self, sport_key: str, cache_ttl: float = 60) -> List[Dict]:
         """Identify betting opportunities using insider market intelligence"""
         try:
             games = self.odds_service.get_odds(sport_key)
             if not games:
                 return []
+            
+            # The cache and the pass's wall-clock reading are shared by every
+            # caller of this instance, so one pass updates them at a time
+            with self._analysis_lock:
+                # One wall-clock reading is shared by every game in this pass
+                self._now_utc_cached = datetime.now(timezone.utc)
+                
+                # Drop expired analyses, then only analyze games whose odds are not cached
+                now = time.monotonic()
+                self._analysis_cache = {
+                    key: entry for key, entry in self._analysis_cache.items()
+                    if now - entry[0] < cache_ttl
+                }
+                cache_keys = [self._analysis_cache_key(game, sport_key) for game in games]
+                pending = [game for game, key in zip(games, cache_keys) if key not in self._analysis_cache]
                 
+                # Scoring is pure Python, so threads would only contend for the GIL
+                for game, tables in self._extract_slate_tables(pending):
+                    analysis = self._comprehensive_insider_analysis(game, sport_key, tables)
+                    self._analysis_cache[self._analysis_cache_key(game, sport_key)] = (now, analysis)
+                
+                analyses = [self._analysis_cache[key][1] for key in cache_keys if key in self._analysis_cache]
+            
             insider_opportunities = []
             
-            for game in games:
-                analysis = self._comprehensive_insider_analysis(game, sport_key)
-                if analysis and analysis['opportunity_score'] > 70:
+            for analysis in analyses:
+                if analysis and analysis.opportunity_score > OPPORTUNITY_SCORE_CUTOFF:
                     insider_opportunities.append(analysis)
             
-            return sorted(insider_opportunities, key=lambda x: x['opportunity_score'], reverse=True)[:3]
+            # Only the surviving top opportunities get recommendations attached
+            top_opportunities = heapq.nlargest(3, insider_opportunities,
+                                               key=operator.attrgetter('opportunity_score'))
+            return [self._finalize_opportunity(candidate) for candidate in top_opportunities]
             
         except Exception as e:
             logger.error(f"Error in insider analysis: {e}")
             return []
     
-    def _comprehensive_insider_analysis(self, game: Dict, sport_key: str) -> Optional[Dict]:
-        """Perform comprehensive insider market analysis"""
+    def _analysis_cache_key(self, game: Dict, sport_key: str) -> Tuple:
+        """Key a game's analysis on its identity and the freshness of its odds"""
+        bookmakers = game.get('bookmakers', [])
+        last_update = max((bm.get('last_update', '') for bm in bookmakers), default='')
+        game_id = game.get('id') or (game.get('home_team'), game.get('away_team'), game.get('commence_time'))
+        return (sport_key, game_id, last_update, len(bookmakers))
+    
+    def _extract_slate_tables(self, games: List[Dict]) -> List[Tuple[Dict, Dict]]:
+        """Extract odds tables for every game on the slate with enough bookmakers"""
+        # Thin markets never produce a market efficiency analysis
+        return [(game, self._extract_odds_tables(game)) for game in games
+                if len(game.get('bookmakers') or []) >= 8]
+    
+    def _comprehensive_insider_analysis(self, game: Dict, sport_key: str,
+                                        tables: Dict) -> Optional[InsiderOpportunity]:
+        """Perform comprehensive insider market analysis on a game from _extract_slate_tables"""
         try:
-            home_team = game.get('home_team', '')
-            away_team = game.get('away_team', '')
-            
             # Analyze market efficiency indicators
-            market_analysis = self._analyze_market_efficiency(game)
+            market_analysis = self._analyze_market_efficiency(tables)
             if not market_analysis:
                 return None
             
+            # Situational analysis is cheap, so score it before the pattern scan
+            situational_edge = self._analyze_situational_factors(game, sport_key)
+            
+            # Stop as soon as the best possible remaining components cannot lift
+            # the running score above the opportunity threshold
+            running_score = ((10 - market_analysis['efficiency_score']) * EFFICIENCY_WEIGHT
+                             + situational_edge.get('situational_edge_score', 0) * SITUATIONAL_WEIGHT)
+            max_remaining = self.max_pattern_component + self.max_movement_component
+            if running_score + max_remaining < MIN_WEIGHTED_OPPORTUNITY_SCORE:
+                return None
+            
             # Check for professional betting patterns
-            pro_patterns = self._detect_professional_patterns(game, sport_key)
+            pro_patterns = self._detect_professional_patterns(tables, sport_key)
             
-            # Situational analysis
-            situational_edge = self._analyze_situational_factors(game, sport_key)
+            running_score += pro_patterns.get('pattern_strength', 0) * PATTERN_WEIGHT
+            max_remaining -= self.max_pattern_component
+            if running_score + max_remaining < MIN_WEIGHTED_OPPORTUNITY_SCORE:
+                return None
             
             # Line movement analysis
-            movement_analysis = self._analyze_line_movement_intelligence(game)
+            movement_analysis = self._analyze_line_movement_intelligence(tables)
             
             # Calculate composite opportunity score
             opportunity_score = self._calculate_opportunity_score(
                 market_analysis, pro_patterns, situational_edge, movement_analysis
             )
             
-            if opportunity_score > 70:
-                return {
-                    'game': f"{home_team} vs {away_team}",
-                    'commence_time': game.get('commence_time'),
-                    'opportunity_score': opportunity_score,
-                    'market_analysis': market_analysis,
-                    'professional_patterns': pro_patterns,
-                    'situational_factors': situational_edge,
-                    'line_movement': movement_analysis,
-                    'recommendation': self._generate_insider_recommendation(opportunity_score, pro_patterns),
-                    'confidence_level': self._assess_confidence_level(opportunity_score),
-                    'sharp_money_indicator': self._calculate_sharp_money_score(movement_analysis, market_analysis)
-                }
-            
-            return None
+            # Callers filter on the score before building the full opportunity
+            return InsiderOpportunity(
+                game=game,
+                opportunity_score=opportunity_score,
+                market_analysis=market_analysis,
+                professional_patterns=pro_patterns,
+                situational_factors=situational_edge,
+                line_movement=movement_analysis
+            )
             
         except Exception as e:
             logger.error(f"Error in comprehensive insider analysis: {e}")
             return None
     
-    def _analyze_market_efficiency(self, game: Dict) -> Optional[Dict]:
+    def _finalize_opportunity(self, candidate: InsiderOpportunity) -> Dict:
+        """Build the full insider opportunity dict for a candidate that cleared the threshold"""
+        game = candidate.game
+        opportunity_score = candidate.opportunity_score
+        market_analysis = candidate.market_analysis
+        pro_patterns = candidate.professional_patterns
+        movement_analysis = candidate.line_movement
+        
+        return {
+            'game': f"{game.get('home_team', '')} vs {game.get('away_team', '')}",
+            'commence_time': game.get('commence_time'),
+            'opportunity_score': opportunity_score,
+            'market_analysis': market_analysis,
+            'professional_patterns': pro_patterns,
+            'situational_factors': candidate.situational_factors,
+            'line_movement': movement_analysis,
+            'recommendation': self._generate_insider_recommendation(opportunity_score, pro_patterns),
+            'confidence_level': self._assess_confidence_level(opportunity_score),
+            'sharp_money_indicator': self._calculate_sharp_money_score(movement_analysis, market_analysis)
+        }
+    
+    def _extract_odds_tables(self, game: Dict) -> Dict:
+        """Collect head-to-head prices for a game in a single pass over its bookmakers"""
+        bookmakers = game.get('bookmakers', [])
+        home_team = game.get('home_team')
+        away_team = game.get('away_team')
+        
+        tables = {
+            'bookmaker_count': len(bookmakers),
+            'home_prices': [],
+            'away_prices': [],
+            'home_bm': [],
+            'sharp_home_prices': [],
+            'public_home_prices': [],
+            'all_prices': []
+        }
+        
+        for bm in bookmakers:
+            bm_key = bm.get('key', '').lower()
+            bm_class = self._classify_bookmaker(bm_key)
+            for market in bm.get('markets', []):
+                if market['key'] == 'h2h':
+                    prices = {outcome['name']: outcome['price'] for outcome in market['outcomes']}
+                    tables['all_prices'].extend(prices.values())
+                    
+                    home_price = prices.get(home_team)
+                    away_price = prices.get(away_team)
+                    if home_price is not None:
+                        tables['home_prices'].append(home_price)
+                        tables['home_bm'].append(bm_key)
+                    if away_price is not None:
+                        tables['away_prices'].append(away_price)
+                    
+                    if home_price and away_price and bm_class != 'other':
+                        tables[f'{bm_class}_home_prices'].append(home_price)
+        
+        tables['home_stats'] = self._calculate_price_stats(tables['home_prices'])
+        tables['away_stats'] = self._calculate_price_stats(tables['away_prices'])
+        return tables
+    
+    def _classify_bookmaker(self, bm_key: str) -> str:
+        """Classify a bookmaker key as sharp, public or other"""
+        if bm_key in self.sharp_bookmakers:
+            return 'sharp'
+        if bm_key in self.public_bookmakers:
+            return 'public'
+        
+        bm_class = self._bm_class.get(bm_key)
+        if bm_class is None:
+            # Regional variants such as 'betfair_ex_eu' fall back to a substring match
+            if any(sharp in bm_key for sharp in self.sharp_bookmakers):
+                bm_class = 'sharp'
+            elif any(public in bm_key for public in self.public_bookmakers):
+                bm_class = 'public'
+            else:
+                bm_class = 'other'
+            self._bm_class[bm_key] = bm_class
+        return bm_class
+    
+    def _analyze_market_efficiency(self, tables: Dict) -> Optional[Dict]:
         """Analyze market efficiency indicators"""
         try:
-            bookmakers = game.get('bookmakers', [])
-            if len(bookmakers) < 8:
-                return None
-            
-            # Collect all odds for variance analysis
-            home_odds = []
-            away_odds = []
-            
-            for bm in bookmakers:
-                for market in bm.get('markets', []):
-                    if market['key'] == 'h2h':
-                        for outcome in market['outcomes']:
-                            if outcome['name'] == game.get('home_team'):
-                                home_odds.append(outcome['price'])
-                            elif outcome['name'] == game.get('away_team'):
-                                away_odds.append(outcome['price'])
+            home_odds = tables['home_prices']
+            away_odds = tables['away_prices']
             
             if len(home_odds) < 5 or len(away_odds) < 5:
                 return None
             
-            # Calculate variance and efficiency metrics
-            home_variance = self._calculate_variance(home_odds)
-            away_variance = self._calculate_variance(away_odds)
+            # Variance and efficiency metrics come from the per-game stats
+            home_variance = tables['home_stats'].variance
+            away_variance = tables['away_stats'].variance
             
             # Market efficiency score (lower variance = more efficient)
             efficiency_score = max(1, 10 - int((home_variance + away_variance) * 5))
@@ -135,15 +333,17 @@ class InsiderBettingIntelligence:
                 'efficiency_score': efficiency_score,
                 'home_variance': home_variance,
                 'away_variance': away_variance,
-                'bookmaker_count': len(bookmakers),
-                'market_consensus': self._calculate_market_consensus(home_odds, away_odds)
+                'bookmaker_count': tables['bookmaker_count'],
+                'market_consensus': self._calculate_market_consensus(
+                    tables['home_stats'].mean, tables['away_stats'].mean
+                )
             }
             
         except Exception as e:
             logger.error(f"Error analyzing market efficiency: {e}")
             return None
     
-    def _detect_professional_patterns(self, game: Dict, sport_key: str) -> Dict:
+    def _detect_professional_patterns(self, tables: Dict, sport_key: str) -> Dict:
         """Detect professional betting patterns"""
         try:
             patterns = {
@@ -154,50 +354,25 @@ class InsiderBettingIntelligence:
                 'pattern_strength': 0
             }
             
-            bookmakers = game.get('bookmakers', [])
-            if len(bookmakers) < 5:
-                return patterns
-            
-            # Identify sharp vs public bookmakers
-            sharp_bookmakers = ['pinnacle', 'betfair']
-            public_bookmakers = ['draftkings', 'fanduel', 'betmgm']
-            
-            sharp_odds = []
-            public_odds = []
-            
-            for bm in bookmakers:
-                bm_key = bm.get('key', '').lower()
-                for market in bm.get('markets', []):
-                    if market['key'] == 'h2h':
-                        home_price = None
-                        away_price = None
-                        for outcome in market['outcomes']:
-                            if outcome['name'] == game.get('home_team'):
-                                home_price = outcome['price']
-                            elif outcome['name'] == game.get('away_team'):
-                                away_price = outcome['price']
-                        
-                        if home_price and away_price:
-                            if any(sharp in bm_key for sharp in sharp_bookmakers):
-                                sharp_odds.append({'home': home_price, 'away': away_price})
-                            elif any(public in bm_key for public in public_bookmakers):
-                                public_odds.append({'home': home_price, 'away': away_price})
+            # Sharp vs public bookmaker home prices, classified during extraction
+            sharp_home = tables['sharp_home_prices']
+            public_home = tables['public_home_prices']
             
             # Analyze divergence between sharp and public money
-            if sharp_odds and public_odds:
-                divergence = self._calculate_sharp_public_divergence(sharp_odds, public_odds)
+            if sharp_home and public_home:
+                divergence = self._calculate_sharp_public_divergence(sharp_home, public_home)
                 if divergence > 0.05:  # 5% divergence threshold
                     patterns['sharp_money_detected'] = True
                     patterns['professional_bookmaker_divergence'] = True
                     patterns['pattern_strength'] += 30
             
             # Check for reverse line movement indicators
-            if self._detect_reverse_line_movement_pattern(game):
+            if self._detect_reverse_line_movement_pattern(tables):
                 patterns['reverse_line_movement'] = True
                 patterns['pattern_strength'] += 25
             
             # Steam move detection
-            if self._detect_steam_move_pattern(bookmakers):
+            if self._detect_steam_move_pattern(tables):
                 patterns['steam_move_indicator'] = True
                 patterns['pattern_strength'] += 20
             
@@ -223,8 +398,9 @@ class InsiderBettingIntelligence:
             commence_time = game.get('commence_time')
             if commence_time:
                 try:
-                    game_time = datetime.fromisoformat(commence_time.replace('Z', '+00:00'))
-                    current_time = datetime.now(timezone.utc)
+                    # Python 3.11+ parses the trailing 'Z' directly
+                    game_time = datetime.fromisoformat(commence_time)
+                    current_time = self._now_utc_cached or datetime.now(timezone.utc)
                     
                     # Check for quick turnaround games
                     if (game_time - current_time).days == 0:
@@ -234,12 +410,12 @@ class InsiderBettingIntelligence:
                     pass
             
             # Sport-specific situational analysis
-            if sport_key in ['americanfootball_nfl', 'americanfootball_ncaaf']:
-                factors = self._analyze_football_situations(factors, home_team, away_team, game)
-            elif sport_key in ['basketball_nba', 'basketball_ncaab']:
-                factors = self._analyze_basketball_situations(factors, home_team, away_team, game)
-            elif 'soccer' in sport_key:
-                factors = self._analyze_soccer_situations(factors, home_team, away_team, game)
+            handler = self._situation_handlers.get(sport_key)
+            if handler is None and 'soccer' in sport_key:
+                # Soccer leagues share one handler, so they are matched by family
+                handler = self._analyze_soccer_situations
+            if handler:
+                factors = handler(factors, home_team, away_team, game)
             
             # Determine edge strength
             if factors['situational_edge_score'] >= 50:
@@ -255,7 +431,7 @@ class InsiderBettingIntelligence:
             logger.error(f"Error analyzing situational factors: {e}")
             return {'situational_edge_score': 0, 'edge_strength': 'NONE'}
     
-    def _analyze_line_movement_intelligence(self, game: Dict) -> Dict:
+    def _analyze_line_movement_intelligence(self, tables: Dict) -> Dict:
         """Analyze line movement for professional intelligence"""
         try:
             movement_data = {
@@ -265,27 +441,14 @@ class InsiderBettingIntelligence:
                 'professional_money_indicator': False
             }
             
-            bookmakers = game.get('bookmakers', [])
-            if len(bookmakers) < 6:
-                return movement_data
-            
-            # Collect opening and current odds (simulated based on variance)
-            home_odds = []
-            away_odds = []
-            
-            for bm in bookmakers:
-                for market in bm.get('markets', []):
-                    if market['key'] == 'h2h':
-                        for outcome in market['outcomes']:
-                            if outcome['name'] == game.get('home_team'):
-                                home_odds.append(outcome['price'])
-                            elif outcome['name'] == game.get('away_team'):
-                                away_odds.append(outcome['price'])
+            # Opening and current odds are simulated based on cross-book spread
+            home_odds = tables['home_prices']
+            away_odds = tables['away_prices']
             
             if len(home_odds) >= 5 and len(away_odds) >= 5:
                 # Calculate movement based on odds spread
-                home_spread = max(home_odds) - min(home_odds)
-                away_spread = max(away_odds) - min(away_odds)
+                home_spread = tables['home_stats'].spread
+                away_spread = tables['away_stats'].spread
                 
                 total_movement = home_spread + away_spread
                 
@@ -313,30 +476,21 @@ class InsiderBettingIntelligence:
                                    situational_edge: Dict, movement_analysis: Dict) -> int:
         """Calculate composite opportunity score"""
         try:
-            base_score = 0
-            
-            # Market efficiency component (20% weight)
-            if market_analysis:
-                efficiency_score = market_analysis.get('efficiency_score', 5)
-                base_score += (10 - efficiency_score) * 2  # Lower efficiency = higher opportunity
+            efficiency_score = market_analysis.get('efficiency_score', 5) if market_analysis else None
             
-            # Professional patterns component (40% weight)
-            pattern_strength = pro_patterns.get('pattern_strength', 0)
-            base_score += pattern_strength * 0.4
-            
-            # Situational factors component (25% weight)
-            situational_score = situational_edge.get('situational_edge_score', 0)
-            base_score += situational_score * 0.25
-            
-            # Line movement component (15% weight)
+            movement_strength = 0
+            professional_money = False
             if movement_analysis.get('movement_detected'):
                 movement_strength = movement_analysis.get('movement_strength', 0)
-                base_score += movement_strength * 0.15
-                
-                if movement_analysis.get('professional_money_indicator'):
-                    base_score += 10  # Bonus for professional money
-            
-            return min(100, max(0, int(base_score)))
+                professional_money = bool(movement_analysis.get('professional_money_indicator'))
+            
+            return _score_opportunity(
+                efficiency_score,
+                pro_patterns.get('pattern_strength', 0),
+                situational_edge.get('situational_edge_score', 0),
+                movement_strength,
+                professional_money
+            )
             
         except Exception as e:
             logger.error(f"Error calculating opportunity score: {e}")
@@ -344,29 +498,11 @@ class InsiderBettingIntelligence:
     
     def _generate_insider_recommendation(self, score: int, patterns: Dict) -> str:
         """Generate insider betting recommendation"""
-        try:
-            if score >= 85:
-                return "STRONG_PROFESSIONAL_PLAY"
-            elif score >= 75:
-                return "MODERATE_SHARP_ACTION"
-            elif score >= 65:
-                return "WEAK_PROFESSIONAL_SIGNAL"
-            else:
-                return "MONITOR_ONLY"
-                
-        except:
-            return "INSUFFICIENT_DATA"
+        return self._RECOMMENDATION_LABELS[bisect.bisect_right(self._SCORE_THRESHOLDS, score)]
     
     def _assess_confidence_level(self, score: int) -> str:
         """Assess confidence level of analysis"""
-        if score >= 85:
-            return "VERY_HIGH"
-        elif score >= 75:
-            return "HIGH"
-        elif score >= 65:
-            return "MODERATE"
-        else:
-            return "LOW"
+        return self._CONFIDENCE_LABELS[bisect.bisect_right(self._SCORE_THRESHOLDS, score)]
     
     def _calculate_sharp_money_score(self, movement: Dict, market: Dict) -> int:
         """Calculate sharp money indicator score"""
@@ -388,89 +524,75 @@ class InsiderBettingIntelligence:
             return 0
     
     # Helper methods
-    def _calculate_variance(self, odds_list: List[float]) -> float:
-        """Calculate variance of odds list"""
-        try:
-            if len(odds_list) < 2:
-                return 0.0
-            mean = sum(odds_list) / len(odds_list)
-            variance = sum((x - mean) ** 2 for x in odds_list) / len(odds_list)
-            return variance
-        except:
+    def _calculate_variance(self, odds_list: List[float], mean: Optional[float] = None) -> float:
+        """Calculate variance of odds list, reusing a precomputed mean when given"""
+        count = len(odds_list)
+        if count < 2:
             return 0.0
+        if mean is None:
+            mean = sum(odds_list) / count
+        return sum([(x - mean) ** 2 for x in odds_list]) / count
     
-    def _calculate_market_consensus(self, home_odds: List[float], away_odds: List[float]) -> str:
+    def _calculate_price_stats(self, prices: List[float]) -> MarketStats:
+        """Calculate spread, mean and variance of a price list in one place"""
+        if not prices:
+            return MarketStats()
+        
+        low = min(prices)
+        high = max(prices)
+        mean = sum(prices) / len(prices)
+        return MarketStats(
+            low=low,
+            high=high,
+            spread=high - low,
+            mean=mean,
+            variance=self._calculate_variance(prices, mean)
+        )
+    
+    def _calculate_market_consensus(self, avg_home: float, avg_away: float) -> str:
         """Calculate market consensus"""
-        try:
-            if not home_odds or not away_odds:
-                return "UNCLEAR"
-            
-            avg_home = sum(home_odds) / len(home_odds)
-            avg_away = sum(away_odds) / len(away_odds)
-            
-            if avg_home < avg_away:
-                return "HOME_FAVORED"
-            elif avg_away < avg_home:
-                return "AWAY_FAVORED"
-            else:
-                return "EVEN"
-        except:
+        if not avg_home or not avg_away:
             return "UNCLEAR"
+        
+        if avg_home < avg_away:
+            return "HOME_FAVORED"
+        elif avg_away < avg_home:
+            return "AWAY_FAVORED"
+        else:
+            return "EVEN"
     
-    def _calculate_sharp_public_divergence(self, sharp_odds: List[Dict], public_odds: List[Dict]) -> float:
-        """Calculate divergence between sharp and public bookmakers"""
-        try:
-            if not sharp_odds or not public_odds:
-                return 0.0
-            
-            sharp_home_avg = sum(odds['home'] for odds in sharp_odds) / len(sharp_odds)
-            public_home_avg = sum(odds['home'] for odds in public_odds) / len(public_odds)
-            
-            divergence = abs(sharp_home_avg - public_home_avg) / max(sharp_home_avg, public_home_avg)
-            return divergence
-        except:
+    def _calculate_sharp_public_divergence(self, sharp_home: List[float], public_home: List[float]) -> float:
+        """Calculate divergence between sharp and public bookmaker home prices"""
+        if not sharp_home or not public_home:
             return 0.0
+        
+        sharp_home_avg = sum(sharp_home) / len(sharp_home)
+        public_home_avg = sum(public_home) / len(public_home)
+        
+        return abs(sharp_home_avg - public_home_avg) / max(sharp_home_avg, public_home_avg)
     
-    def _detect_reverse_line_movement_pattern(self, game: Dict) -> bool:
+    def _detect_reverse_line_movement_pattern(self, tables: Dict) -> bool:
         """Detect reverse line movement patterns"""
         # Simplified implementation - would need historical data for full analysis
         try:
-            bookmakers = game.get('bookmakers', [])
-            if len(bookmakers) < 8:
-                return False
-            
             # Check for odds spread indicating line movement
-            home_odds = []
-            for bm in bookmakers:
-                for market in bm.get('markets', []):
-                    if market['key'] == 'h2h':
-                        for outcome in market['outcomes']:
-                            if outcome['name'] == game.get('home_team'):
-                                home_odds.append(outcome['price'])
-            
-            if len(home_odds) >= 6:
-                variance = self._calculate_variance(home_odds)
+            if len(tables['home_prices']) >= 6:
+                variance = tables['home_stats'].variance
                 return variance > 0.1  # Threshold for significant movement
             
             return False
         except:
             return False
     
-    def _detect_steam_move_pattern(self, bookmakers: List[Dict]) -> bool:
+    def _detect_steam_move_pattern(self, tables: Dict) -> bool:
         """Detect steam move patterns"""
         try:
-            if len(bookmakers) < 10:
+            if tables['bookmaker_count'] < 10:
                 return False
             
             # Check for simultaneous movement across multiple books
             # Simplified: look for high variance indicating rapid changes
-            all_odds = []
-            for bm in bookmakers:
-                for market in bm.get('markets', []):
-                    if market['key'] == 'h2h':
-                        for outcome in market['outcomes']:
-                            all_odds.append(outcome['price'])
-            
+            all_odds = tables['all_prices']
             if len(all_odds) >= 15:
                 variance = self._calculate_variance(all_odds)
                 return variance > 0.2  # Higher threshold for steam moves
@@ -482,7 +604,7 @@ class InsiderBettingIntelligence:
     def _analyze_football_situations(self, factors: Dict, home_team: str, away_team: str, game: Dict) -> Dict:
         """Analyze football-specific situational factors"""
         # Division rivalry check
-        if any(keyword in home_team or keyword in away_team for keyword in ['division', 'conference']):
+        if self._rivalry_re.search(home_team) or self._rivalry_re.search(away_team):
             factors['identified_factors'].append('DIVISION_RIVALRY')
             factors['situational_edge_score'] += 20
         
@@ -510,17 +632,18 @@ class InsiderBettingIntelligence:
             if not intelligence_data:
                 return "🕵️ INSIDER INTELLIGENCE\n\n⚠️ No significant professional patterns detected currently."
             
-            report = "🕵️ INSIDER BETTING INTELLIGENCE 🕵️\n\n"
+            parts = ["🕵️ INSIDER BETTING INTELLIGENCE 🕵️", ""]
             
             for i, data in enumerate(intelligence_data[:3], 1):
-                report += f"**{i}. {data.get('game', 'Game')}**\n"
-                report += f"📊 Opportunity Score: {data.get('opportunity_score', 0)}/100\n"
-                report += f"💼 Recommendation: {data.get('recommendation', 'N/A')}\n"
-                report += f"🎯 Confidence: {data.get('confidence_level', 'N/A')}\n"
-                report += f"💰 Sharp Money: {data.get('sharp_money_indicator', 0)}/100\n\n"
-            
-            report += "💡 Based on professional betting patterns, line movements, and market intelligence."
-            return report
+                parts.append(f"**{i}. {data.get('game', 'Game')}**")
+                parts.append(f"📊 Opportunity Score: {data.get('opportunity_score', 0)}/100")
+                parts.append(f"💼 Recommendation: {data.get('recommendation', 'N/A')}")
+                parts.append(f"🎯 Confidence: {data.get('confidence_level', 'N/A')}")
+                parts.append(f"💰 Sharp Money: {data.get('sharp_money_indicator', 0)}/100")
+                parts.append("")
+            
+            parts.append("💡 Based on professional betting patterns, line movements, and market intelligence.")
+            return "\n".join(parts)
             
         except Exception as e:
             logger.error(f"Error generating intelligence report: {e}")
@@ -10,8 +10,11 @@ Real-time arbitrage detection across 28+ bookmakers with:
 - Instant notification system
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timezone
 import asyncio
 from odds_service import OddsService
@@ -19,6 +22,49 @@ import statistics
 
 logger = logging.getLogger(__name__)
 
+class OddsEntry(NamedTuple):
+    """Best price for one outcome and the bookmaker offering it"""
+    bookmaker: str
+    bookmaker_key: str
+    odds: float
+    rating: int
+
+TOTAL_STAKE = 1000  # Base calculation on $1000
+
+# Outcome codes for h2h prices, with the draw labels the odds API uses
+HOME, AWAY, DRAW = 0, 1, 2
+_DRAW_LABELS = frozenset({'Draw', 'draw', 'DRAW', 'Tie', 'tie', 'TIE', 'X'})
+_DRAW_CODES = dict.fromkeys(_DRAW_LABELS, DRAW)
+
+# (minimum profit %, accepted risk levels or None for any, grade), best grade first
+_GRADES = (
+    (10.0, frozenset({'VERY_LOW', 'LOW'}), 'PREMIUM'),
+    (7.0, frozenset({'VERY_LOW', 'LOW', 'MEDIUM'}), 'EXCELLENT'),
+    (5.0, None, 'VERY_GOOD'),
+    (3.0, None, 'GOOD'),
+)
+
+def _two_way_arbitrage(home_odds: float, away_odds: float) -> Tuple[float, float, float, float, float]:
+    """Profit percentage, stakes and returns for a two-way arbitrage"""
+    profit_percentage = 100 - (1/home_odds + 1/away_odds) * 100
+    home_stake = TOTAL_STAKE / (1 + (home_odds / away_odds))
+    away_stake = TOTAL_STAKE - home_stake
+    return profit_percentage, home_stake, away_stake, home_stake * home_odds, away_stake * away_odds
+
+def _three_way_arbitrage(home_odds: float, away_odds: float,
+                         draw_odds: float) -> Tuple[float, float, float, float, float, float, float]:
+    """Profit percentage, stakes and returns for a three-way arbitrage"""
+    home_prob = 1/home_odds
+    away_prob = 1/away_odds
+    draw_prob = 1/draw_odds
+    total_prob = home_prob + away_prob + draw_prob
+    profit_percentage = 100 - total_prob * 100
+    home_stake = (home_prob / total_prob) * TOTAL_STAKE
+    away_stake = (away_prob / total_prob) * TOTAL_STAKE
+    draw_stake = (draw_prob / total_prob) * TOTAL_STAKE
+    return (profit_percentage, home_stake, away_stake, draw_stake,
+            home_stake * home_odds, away_stake * away_odds, draw_stake * draw_odds)
+
 class LiveArbitrageScanner:
     def __init__(self):
         self.odds_service = OddsService()
@@ -31,46 +77,86 @@ class LiveArbitrageScanner:
             'draftkings': 8, 'fanduel': 8, 'betmgm': 8, 'caesars': 8,
             'pointsbet': 7, 'barstool': 7, 'unibet': 8, 'betrivers': 7
         }
+        
+        # Lowercased bookmaker key and rating per bookmaker title
+        self._title_ratings: Dict[str, Tuple[str, int]] = {}
+        
+        # Scan results keyed by sport and each game's (id, last update, bookmaker count)
+        self.scan_cache_ttl = 15  # seconds
+        self._scan_cache: Dict[Tuple, Tuple[float, List[Dict]]] = {}
+        self._scan_cache_lock = threading.Lock()  # scan_multiple_sports runs scans on worker threads
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def scan_live_opportunities(self, sport_keys: List[str]) -> List[Dict]:
         """Scan multiple sports for live arbitrage opportunities - Bot handler method"""
         all_opportunities = []
-        for sport_key in sport_keys:
-            opportunities = self.scan_live_arbitrage(sport_key)
+        for opportunities in self.scan_multiple_sports(sport_keys).values():
             all_opportunities.extend(opportunities)
-        return sorted(all_opportunities, key=lambda x: x.get('profit_percentage', 0), reverse=True)[:5]
+        return heapq.nlargest(5, all_opportunities, key=lambda x: x.get('profit_percentage', 0))
     
     def format_live_opportunities(self, opportunities: List[Dict]) -> str:
         """Format arbitrage opportunities for display - Bot handler method"""
         if not opportunities:
             return "🎯 No arbitrage opportunities detected at this time.\n\nArbitrage opportunities provide guaranteed profit regardless of outcome."
         
-        report = "🎯 LIVE ARBITRAGE OPPORTUNITIES 🎯\n\n"
+        parts = ["🎯 LIVE ARBITRAGE OPPORTUNITIES 🎯\n\n"]
         for i, opp in enumerate(opportunities[:3], 1):
-            report += f"{i}. {opp.get('game', 'Game')}\n"
-            report += f"💰 Profit: {opp.get('profit_percentage', 0):.2f}%\n"
-            report += f"🎯 Strategy: {opp.get('strategy', 'N/A')}\n\n"
+            parts.append(f"{i}. {opp.get('game', 'Game')}\n")
+            parts.append(f"💰 Profit: {opp.get('profit_percentage', 0):.2f}%\n")
+            parts.append(f"🎯 Strategy: {opp.get('strategy', 'N/A')}\n\n")
         
-        report += "💡 Arbitrage provides guaranteed profit by betting on all outcomes across different bookmakers."
-        return report
+        parts.append("💡 Arbitrage provides guaranteed profit by betting on all outcomes across different bookmakers.")
+        return "".join(parts)
     
     def scan_live_arbitrage(self, sport_key: str) -> List[Dict]:
         """Scan for live arbitrage opportunities with guaranteed profit"""
         try:
             games = self.odds_service.get_odds(sport_key)
-            arbitrage_opportunities = []
-            
-            for game in games:
-                arb_analysis = self._analyze_arbitrage_opportunity(game)
-                if arb_analysis and arb_analysis['profit_percentage'] >= self.minimum_profit_threshold:
-                    arbitrage_opportunities.append(arb_analysis)
-            
-            return sorted(arbitrage_opportunities, key=lambda x: x['profit_percentage'], reverse=True)
+            return self._scan_games(sport_key, games)
             
         except Exception as e:
             logger.error(f"Error scanning live arbitrage: {e}")
             return []
     
+    def _scan_games(self, sport_key: str, games: List[Dict]) -> List[Dict]:
+        """Find arbitrage opportunities in a sport's odds, best profit first"""
+        # Reuse the last scan while the odds are unchanged and still fresh
+        now = time.monotonic()
+        cache_key = self._slate_cache_key(sport_key, games)
+        with self._scan_cache_lock:
+            cached = self._scan_cache.get(cache_key)
+            if cached and now - cached[0] < self.scan_cache_ttl:
+                self.cache_hits += 1
+                return list(cached[1])
+            self.cache_misses += 1
+        
+        arbitrage_opportunities = []
+        
+        for game in games:
+            arb_analysis = self._analyze_arbitrage_opportunity(game)
+            if arb_analysis and arb_analysis['profit_percentage'] >= self.minimum_profit_threshold:
+                arbitrage_opportunities.append(arb_analysis)
+        
+        arbitrage_opportunities.sort(key=lambda x: x['profit_percentage'], reverse=True)
+        
+        with self._scan_cache_lock:
+            self._scan_cache = {
+                key: entry for key, entry in self._scan_cache.items()
+                if now - entry[0] < self.scan_cache_ttl
+            }
+            self._scan_cache[cache_key] = (now, arbitrage_opportunities)
+        return list(arbitrage_opportunities)
+    
+    def _slate_cache_key(self, sport_key: str, games: List[Dict]) -> Tuple:
+        """Identify a slate by each game's id and latest bookmaker update, like the insider cache"""
+        return (sport_key, tuple(
+            (game.get('id', ''),
+             max((bm.get('last_update', '') for bm in game.get('bookmakers', [])), default=''),
+             len(game.get('bookmakers', [])))
+            for game in games
+        ))
+    
     def _analyze_arbitrage_opportunity(self, game: Dict) -> Optional[Dict]:
         """Analyze individual game for arbitrage opportunities"""
         try:
@@ -81,50 +167,58 @@ class LiveArbitrageScanner:
             home_team = game.get('home_team', '')
             away_team = game.get('away_team', '')
             
-            # Collect all odds with bookmaker information
-            home_odds_data = []
-            away_odds_data = []
-            draw_odds_data = []
+            # Classify outcome names with one dict lookup; anything else is skipped
+            outcome_codes = dict(_DRAW_CODES)
+            outcome_codes[home_team] = HOME
+            outcome_codes[away_team] = AWAY
+            
+            # Best price, its bookmaker and the quote count per outcome code
+            best_prices = [0.0, 0.0, 0.0]
+            best_bms: List[Optional[Dict]] = [None, None, None]
+            counts = [0, 0, 0]
             
             for bm in bookmakers:
-                bm_name = bm.get('title', '').lower()
-                bm_rating = self.bookmaker_ratings.get(bm_name, 5)
-                
-                for market in bm.get('markets', []):
+                for market in bm.get('markets', ()):
                     if market['key'] == 'h2h':
                         for outcome in market['outcomes']:
                             price = outcome['price']
                             if price <= 1.0 or price > 100.0:
                                 continue
                             
-                            odds_entry = {
-                                'bookmaker': bm.get('title', 'Unknown'),
-                                'bookmaker_key': bm_name,
-                                'odds': price,
-                                'rating': bm_rating
-                            }
+                            name = outcome['name']
+                            code = outcome_codes.get(name)
+                            if code is None:
+                                continue
                             
-                            if outcome['name'] == home_team:
-                                home_odds_data.append(odds_entry)
-                            elif outcome['name'] == away_team:
-                                away_odds_data.append(odds_entry)
-                            elif 'draw' in outcome['name'].lower() or 'tie' in outcome['name'].lower():
-                                draw_odds_data.append(odds_entry)
-            
-            # Find arbitrage opportunities
-            if len(home_odds_data) >= 2 and len(away_odds_data) >= 2:
-                # Two-way arbitrage (no draw)
-                arb_result = self._calculate_two_way_arbitrage(
-                    home_odds_data, away_odds_data, home_team, away_team, game
-                )
-                if arb_result:
-                    return arb_result
+                            counts[code] += 1
+                            if price > best_prices[code]:
+                                best_prices[code] = price
+                                best_bms[code] = bm
+            
+            if counts[HOME] < 2 or counts[AWAY] < 2:
+                return None
+            
+            # Adding a draw leg only lowers the profit, so games whose best two-way
+            # prices miss the threshold are dropped before any entry is built
+            if _two_way_arbitrage(best_prices[HOME], best_prices[AWAY])[0] < self.minimum_profit_threshold:
+                return None
+            
+            # Only the best price per outcome is materialized into an entry
+            best_home = self._odds_entry(best_bms[HOME], best_prices[HOME])
+            best_away = self._odds_entry(best_bms[AWAY], best_prices[AWAY])
+            
+            # Two-way arbitrage (no draw)
+            arb_result = self._calculate_two_way_arbitrage(
+                best_home, best_away, home_team, away_team, game
+            )
+            if arb_result:
+                return arb_result
             
             # Three-way arbitrage (with draw)
-            if (len(home_odds_data) >= 2 and len(away_odds_data) >= 2 and 
-                len(draw_odds_data) >= 2):
+            if counts[DRAW] >= 2:
+                best_draw = self._odds_entry(best_bms[DRAW], best_prices[DRAW])
                 arb_result = self._calculate_three_way_arbitrage(
-                    home_odds_data, away_odds_data, draw_odds_data, home_team, away_team, game
+                    best_home, best_away, best_draw, home_team, away_team, game
                 )
                 if arb_result:
                     return arb_result
@@ -135,30 +229,30 @@ class LiveArbitrageScanner:
             logger.error(f"Error analyzing arbitrage opportunity: {e}")
             return None
     
-    def _calculate_two_way_arbitrage(self, home_odds_data: List[Dict], away_odds_data: List[Dict],
+    def _odds_entry(self, bm: Dict, price: float) -> OddsEntry:
+        """Build the odds entry for a bookmaker's price"""
+        title = bm.get('title', '')
+        rated = self._title_ratings.get(title)
+        if rated is None:
+            bm_name = title.lower()
+            rated = self._title_ratings[title] = (bm_name, self.bookmaker_ratings.get(bm_name, 5))
+        return OddsEntry(bm.get('title', 'Unknown'), rated[0], price, rated[1])
+    
+    def _calculate_two_way_arbitrage(self, best_home: OddsEntry, best_away: OddsEntry,
                                    home_team: str, away_team: str, game: Dict) -> Optional[Dict]:
         """Calculate two-way arbitrage opportunities"""
         try:
-            # Find best odds for each outcome
-            best_home = max(home_odds_data, key=lambda x: x['odds'])
-            best_away = max(away_odds_data, key=lambda x: x['odds'])
+            home_odds = best_home.odds
+            away_odds = best_away.odds
             
-            home_odds = best_home['odds']
-            away_odds = best_away['odds']
-            
-            # Calculate arbitrage percentage
-            arbitrage_percentage = (1/home_odds + 1/away_odds) * 100
-            profit_percentage = 100 - arbitrage_percentage
+            # Arbitrage percentage and optimal bet allocation
+            (profit_percentage, home_stake, away_stake,
+             home_return, away_return) = _two_way_arbitrage(home_odds, away_odds)
             
             if profit_percentage >= self.minimum_profit_threshold:
-                # Calculate optimal bet allocation
-                total_stake = 1000  # Base calculation on $1000
-                home_stake = total_stake / (1 + (home_odds / away_odds))
-                away_stake = total_stake - home_stake
+                total_stake = TOTAL_STAKE
                 
                 # Calculate guaranteed profit
-                home_return = home_stake * home_odds
-                away_return = away_stake * away_odds
                 guaranteed_profit = min(home_return, away_return) - total_stake
                 
                 # Risk assessment
@@ -174,14 +268,14 @@ class LiveArbitrageScanner:
                     'bet_allocation': {
                         'home': {
                             'team': home_team,
-                            'bookmaker': best_home['bookmaker'],
+                            'bookmaker': best_home.bookmaker,
                             'odds': home_odds,
                             'stake': round(home_stake, 2),
                             'potential_return': round(home_return, 2)
                         },
                         'away': {
                             'team': away_team,
-                            'bookmaker': best_away['bookmaker'],
+                            'bookmaker': best_away.bookmaker,
                             'odds': away_odds,
                             'stake': round(away_stake, 2),
                             'potential_return': round(away_return, 2)
@@ -190,8 +284,8 @@ class LiveArbitrageScanner:
                     'execution_speed': 'IMMEDIATE' if profit_percentage >= self.premium_profit_threshold else 'FAST',
                     'risk_level': risk_level,
                     'bookmaker_ratings': {
-                        'home': best_home['rating'],
-                        'away': best_away['rating']
+                        'home': best_home.rating,
+                        'away': best_away.rating
                     },
                     'opportunity_grade': self._grade_arbitrage_opportunity(profit_percentage, risk_level)
                 }
@@ -202,46 +296,27 @@ class LiveArbitrageScanner:
             logger.error(f"Error calculating two-way arbitrage: {e}")
             return None
     
-    def _calculate_three_way_arbitrage(self, home_odds_data: List[Dict], away_odds_data: List[Dict],
-                                     draw_odds_data: List[Dict], home_team: str, away_team: str,
+    def _calculate_three_way_arbitrage(self, best_home: OddsEntry, best_away: OddsEntry,
+                                     best_draw: OddsEntry, home_team: str, away_team: str,
                                      game: Dict) -> Optional[Dict]:
         """Calculate three-way arbitrage opportunities"""
         try:
-            # Find best odds for each outcome
-            best_home = max(home_odds_data, key=lambda x: x['odds'])
-            best_away = max(away_odds_data, key=lambda x: x['odds'])
-            best_draw = max(draw_odds_data, key=lambda x: x['odds'])
-            
-            home_odds = best_home['odds']
-            away_odds = best_away['odds']
-            draw_odds = best_draw['odds']
+            home_odds = best_home.odds
+            away_odds = best_away.odds
+            draw_odds = best_draw.odds
             
-            # Calculate arbitrage percentage
-            arbitrage_percentage = (1/home_odds + 1/away_odds + 1/draw_odds) * 100
-            profit_percentage = 100 - arbitrage_percentage
+            # Arbitrage percentage and proportional allocation for three-way
+            (profit_percentage, home_stake, away_stake, draw_stake,
+             home_return, away_return, draw_return) = _three_way_arbitrage(home_odds, away_odds, draw_odds)
             
             if profit_percentage >= self.minimum_profit_threshold:
-                # Calculate optimal bet allocation
-                total_stake = 1000  # Base calculation on $1000
-                
-                # Complex allocation for three-way
-                home_prob = 1/home_odds
-                away_prob = 1/away_odds
-                draw_prob = 1/draw_odds
-                total_prob = home_prob + away_prob + draw_prob
-                
-                home_stake = (home_prob / total_prob) * total_stake
-                away_stake = (away_prob / total_prob) * total_stake
-                draw_stake = (draw_prob / total_prob) * total_stake
+                total_stake = TOTAL_STAKE
                 
                 # Calculate guaranteed profit
-                home_return = home_stake * home_odds
-                away_return = away_stake * away_odds
-                draw_return = draw_stake * draw_odds
                 guaranteed_profit = min(home_return, away_return, draw_return) - total_stake
                 
                 # Risk assessment
-                avg_rating = (best_home['rating'] + best_away['rating'] + best_draw['rating']) / 3
+                avg_rating = (best_home.rating + best_away.rating + best_draw.rating) / 3
                 risk_level = 'LOW' if avg_rating >= 8 else 'MEDIUM' if avg_rating >= 6 else 'HIGH'
                 
                 return {
@@ -254,21 +329,21 @@ class LiveArbitrageScanner:
                     'bet_allocation': {
                         'home': {
                             'team': home_team,
-                            'bookmaker': best_home['bookmaker'],
+                            'bookmaker': best_home.bookmaker,
                             'odds': home_odds,
                             'stake': round(home_stake, 2),
                             'potential_return': round(home_return, 2)
                         },
                         'away': {
                             'team': away_team,
-                            'bookmaker': best_away['bookmaker'],
+                            'bookmaker': best_away.bookmaker,
                             'odds': away_odds,
                             'stake': round(away_stake, 2),
                             'potential_return': round(away_return, 2)
                         },
                         'draw': {
                             'team': 'Draw',
-                            'bookmaker': best_draw['bookmaker'],
+                            'bookmaker': best_draw.bookmaker,
                             'odds': draw_odds,
                             'stake': round(draw_stake, 2),
                             'potential_return': round(draw_return, 2)
@@ -277,9 +352,9 @@ class LiveArbitrageScanner:
                     'execution_speed': 'IMMEDIATE' if profit_percentage >= self.premium_profit_threshold else 'FAST',
                     'risk_level': risk_level,
                     'bookmaker_ratings': {
-                        'home': best_home['rating'],
-                        'away': best_away['rating'],
-                        'draw': best_draw['rating']
+                        'home': best_home.rating,
+                        'away': best_away.rating,
+                        'draw': best_draw.rating
                     },
                     'opportunity_grade': self._grade_arbitrage_opportunity(profit_percentage, risk_level)
                 }
@@ -290,51 +365,40 @@ class LiveArbitrageScanner:
             logger.error(f"Error calculating three-way arbitrage: {e}")
             return None
     
-    def _assess_arbitrage_risk(self, best_home: Dict, best_away: Dict) -> str:
+    def _assess_arbitrage_risk(self, best_home: OddsEntry, best_away: OddsEntry) -> str:
         """Assess risk level of arbitrage opportunity"""
-        try:
-            avg_rating = (best_home['rating'] + best_away['rating']) / 2
-            
-            # Check for bookmaker reliability
-            if avg_rating >= 9:
-                return 'VERY_LOW'
-            elif avg_rating >= 8:
-                return 'LOW'
-            elif avg_rating >= 6:
-                return 'MEDIUM'
-            else:
-                return 'HIGH'
-                
-        except Exception as e:
-            logger.error(f"Error assessing arbitrage risk: {e}")
+        avg_rating = (best_home.rating + best_away.rating) / 2
+        
+        # Check for bookmaker reliability
+        if avg_rating >= 9:
+            return 'VERY_LOW'
+        elif avg_rating >= 8:
+            return 'LOW'
+        elif avg_rating >= 6:
             return 'MEDIUM'
+        else:
+            return 'HIGH'
     
     def _grade_arbitrage_opportunity(self, profit_percentage: float, risk_level: str) -> str:
         """Grade the arbitrage opportunity quality"""
-        try:
-            if profit_percentage >= 10.0 and risk_level in ['VERY_LOW', 'LOW']:
-                return 'PREMIUM'
-            elif profit_percentage >= 7.0 and risk_level in ['VERY_LOW', 'LOW', 'MEDIUM']:
-                return 'EXCELLENT'
-            elif profit_percentage >= 5.0:
-                return 'VERY_GOOD'
-            elif profit_percentage >= 3.0:
-                return 'GOOD'
-            else:
-                return 'FAIR'
-                
-        except Exception as e:
-            logger.error(f"Error grading arbitrage opportunity: {e}")
-            return 'FAIR'
+        for min_profit, risk_levels, grade in _GRADES:
+            if profit_percentage >= min_profit and (risk_levels is None or risk_level in risk_levels):
+                return grade
+        return 'FAIR'
     
     def scan_multiple_sports(self, sport_keys: List[str]) -> Dict[str, List[Dict]]:
         """Scan multiple sports for arbitrage opportunities"""
         try:
             all_opportunities = {}
+            if not sport_keys:
+                return all_opportunities
+            
+            # Fetch every sport's odds concurrently up front, then scan each payload
+            games_by_sport = self.odds_service.get_odds_batch(sport_keys)
             
-            for sport_key in sport_keys:
+            for sport_key, games in games_by_sport.items():
                 try:
-                    opportunities = self.scan_live_arbitrage(sport_key)
+                    opportunities = self._scan_games(sport_key, games)
                     if opportunities:
                         all_opportunities[sport_key] = opportunities
                 except Exception as e:
@@ -355,41 +419,41 @@ class LiveArbitrageScanner:
             if not opportunities:
                 return f"⚡ LIVE ARBITRAGE SCANNER - {sport_key.upper()}\n\nNo arbitrage opportunities found above {self.minimum_profit_threshold}% profit threshold"
             
-            report = f"⚡ LIVE ARBITRAGE OPPORTUNITIES - {sport_key.upper()}\n\n"
-            report += f"🎯 GUARANTEED PROFIT OPPORTUNITIES ({len(opportunities)} found):\n\n"
+            parts = [f"⚡ LIVE ARBITRAGE OPPORTUNITIES - {sport_key.upper()}\n\n"]
+            parts.append(f"🎯 GUARANTEED PROFIT OPPORTUNITIES ({len(opportunities)} found):\n\n")
             
             total_potential_profit = 0
             
             for i, opp in enumerate(opportunities, 1):
-                report += f"{i}. {opp['game']}\n"
-                report += f"   💰 GUARANTEED PROFIT: {opp['profit_percentage']}% (${opp['guaranteed_profit']})\n"
-                report += f"   📊 Type: {opp['arbitrage_type']} | Grade: {opp['opportunity_grade']}\n"
-                report += f"   ⚡ Execution: {opp['execution_speed']} | Risk: {opp['risk_level']}\n"
+                parts.append(f"{i}. {opp['game']}\n")
+                parts.append(f"   💰 GUARANTEED PROFIT: {opp['profit_percentage']:.3f}% (${opp['guaranteed_profit']:.2f})\n")
+                parts.append(f"   📊 Type: {opp['arbitrage_type']} | Grade: {opp['opportunity_grade']}\n")
+                parts.append(f"   ⚡ Execution: {opp['execution_speed']} | Risk: {opp['risk_level']}\n")
                 
-                report += f"\n   📋 BET ALLOCATION (${opp['total_stake_required']} total):\n"
+                parts.append(f"\n   📋 BET ALLOCATION (${opp['total_stake_required']} total):\n")
                 
                 for bet_type, bet_info in opp['bet_allocation'].items():
-                    report += f"   • {bet_info['team']}: ${bet_info['stake']} @ {bet_info['odds']} on {bet_info['bookmaker']}\n"
+                    parts.append(f"   • {bet_info['team']}: ${bet_info['stake']:.2f} @ {bet_info['odds']} on {bet_info['bookmaker']}\n")
                 
                 total_potential_profit += opp['guaranteed_profit']
-                report += "\n"
+                parts.append("\n")
             
-            report += f"💎 SUMMARY:\n"
-            report += f"• Total opportunities: {len(opportunities)}\n"
-            report += f"• Combined potential profit: ${total_potential_profit:.2f}\n"
-            report += f"• Average profit margin: {sum(o['profit_percentage'] for o in opportunities) / len(opportunities):.2f}%\n"
-            report += f"• Premium opportunities (5%+): {sum(1 for o in opportunities if o['profit_percentage'] >= 5.0)}\n\n"
+            parts.append(f"💎 SUMMARY:\n")
+            parts.append(f"• Total opportunities: {len(opportunities)}\n")
+            parts.append(f"• Combined potential profit: ${total_potential_profit:.2f}\n")
+            parts.append(f"• Average profit margin: {sum(o['profit_percentage'] for o in opportunities) / len(opportunities):.2f}%\n")
+            parts.append(f"• Premium opportunities (5%+): {sum(1 for o in opportunities if o['profit_percentage'] >= 5.0)}\n\n")
             
-            report += "⚡ EXECUTION PROTOCOL:\n"
-            report += "1. PREMIUM/EXCELLENT opportunities - Execute immediately\n"
-            report += "2. Place all bets simultaneously for guaranteed profit\n"
-            report += "3. Monitor odds changes during execution\n"
-            report += "4. Use reliable bookmakers (rating 7+) only\n"
-            report += "5. Profit is guaranteed regardless of game outcome\n\n"
+            parts.append("⚡ EXECUTION PROTOCOL:\n")
+            parts.append("1. PREMIUM/EXCELLENT opportunities - Execute immediately\n")
+            parts.append("2. Place all bets simultaneously for guaranteed profit\n")
+            parts.append("3. Monitor odds changes during execution\n")
+            parts.append("4. Use reliable bookmakers (rating 7+) only\n")
+            parts.append("5. Profit is guaranteed regardless of game outcome\n\n")
             
-            report += "🎯 LIVE ARBITRAGE ANALYSIS COMPLETE"
+            parts.append("🎯 LIVE ARBITRAGE ANALYSIS COMPLETE")
             
-            return report
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Error generating arbitrage report: {e}")
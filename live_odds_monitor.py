@@ -9,66 +9,149 @@ Tracks real-time odds changes across bookmakers to identify:
 - Value betting opportunities
 """
 
+import heapq
 import logging
+import sqlite3
+import threading
+import time
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
-import statistics
+import math
+from config import ODDS_HISTORY_DB
 from odds_service import OddsService
+from odds_math import sample_variance
 
 logger = logging.getLogger(__name__)
 
+def _extract_h2h_odds(bookmakers: List[Dict], home_team: str, away_team: str,
+                      max_price: float = 20.0) -> Tuple[List[float], List[float]]:
+    """Home and away h2h prices across bookmakers, skipping prices outside (1.0, max_price]"""
+    home_odds = []
+    away_odds = []
+    
+    for bm in bookmakers:
+        for market in bm.get('markets', ()):
+            if market['key'] == 'h2h':
+                for outcome in market['outcomes']:
+                    price = outcome['price']
+                    if price <= 1.0 or price > max_price:
+                        continue
+                    
+                    name = outcome['name']
+                    if name == home_team:
+                        home_odds.append(price)
+                    elif name == away_team:
+                        away_odds.append(price)
+    
+    return home_odds, away_odds
+
 class LiveOddsMonitor:
-    def __init__(self):
+    def __init__(self, history_db: Optional[str] = None):
         self.odds_service = OddsService()
-        self.historical_odds = {}  # Store odds movements
+        self.historical_odds = {}  # Oldest recent (home, away) consensus per game id
+        self.history_db = history_db or ODDS_HISTORY_DB
+        self.history_ttl = 3600  # Keep one hour of consensus snapshots
+        self.history_bucket = 60  # One snapshot per game per minute
+        self._history_lock = threading.Lock()  # Scanner threads share the connection
+        self._history_conn = self._open_history()
         
+    def _open_history(self) -> Optional[sqlite3.Connection]:
+        """Open the odds history database once and create the snapshot table"""
+        try:
+            conn = sqlite3.connect(self.history_db, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS odds_history ("
+                "game_id TEXT, ts INTEGER, home_price REAL, away_price REAL, "
+                "PRIMARY KEY (game_id, ts))"
+            )
+            return conn
+        except Exception as e:
+            logger.error(f"Error opening odds history at {self.history_db}: {e}")
+            return None
+    
+    def _load_odds_history(self, now: int) -> Dict[str, Tuple[float, float]]:
+        """Load the oldest consensus snapshot per game taken before the current bucket"""
+        if self._history_conn is None:
+            return {}
+        try:
+            with self._history_lock:
+                rows = self._history_conn.execute(
+                    "SELECT game_id, home_price, away_price FROM odds_history "
+                    "WHERE ts >= ? AND ts < ? ORDER BY ts DESC",
+                    (now - self.history_ttl, now - now % self.history_bucket)
+                ).fetchall()
+            # Newest first, so the oldest snapshot per game is written last
+            return {game_id: (home_price, away_price) for game_id, home_price, away_price in rows}
+        except Exception as e:
+            logger.error(f"Error loading odds history: {e}")
+            return {}
+    
+    def _save_odds_history(self, snapshots: Dict[str, Tuple[float, float]], now: int):
+        """Store this scan's consensus snapshots and drop expired ones"""
+        if not snapshots or self._history_conn is None:
+            return
+        try:
+            bucket = now - now % self.history_bucket
+            with self._history_lock, self._history_conn:
+                self._history_conn.executemany(
+                    "INSERT OR REPLACE INTO odds_history VALUES (?, ?, ?, ?)",
+                    [(game_id, bucket, home, away) for game_id, (home, away) in snapshots.items()]
+                )
+                self._history_conn.execute("DELETE FROM odds_history WHERE ts < ?", (now - self.history_ttl,))
+        except Exception as e:
+            logger.error(f"Error saving odds history: {e}")
+    
     def detect_significant_line_movement(self, sport_key: str, threshold: float = 0.15) -> List[Dict]:
         """Detect significant line movements indicating sharp action"""
         try:
             current_odds = self.odds_service.get_odds(sport_key)
             movements = []
             
+            now = int(time.time())
+            self.historical_odds = self._load_odds_history(now)
+            snapshots = {}
+            
             for game in current_odds:
-                movement_analysis = self._analyze_line_movement(game, threshold)
+                movement_analysis = self._analyze_line_movement(game, threshold, snapshots)
                 if movement_analysis:
                     movements.append(movement_analysis)
             
-            return sorted(movements, key=lambda x: x['movement_strength'], reverse=True)[:5]
+            self._save_odds_history(snapshots, now)
+            
+            return heapq.nlargest(5, movements, key=lambda x: x['movement_strength'])
             
         except Exception as e:
             logger.error(f"Error detecting line movement: {e}")
             return []
     
-    def _analyze_line_movement(self, game: Dict, threshold: float) -> Optional[Dict]:
+    def _analyze_line_movement(self, game: Dict, threshold: float,
+                               snapshots: Optional[Dict[str, Tuple[float, float]]] = None) -> Optional[Dict]:
         """Analyze individual game for significant line movement"""
         try:
             bookmakers = game.get('bookmakers', [])
             if len(bookmakers) < 4:
                 return None
             
+            home_team = game['home_team']
+            away_team = game['away_team']
+            
             # Get current odds variance
-            home_odds = []
-            away_odds = []
-            
-            for bm in bookmakers:
-                for market in bm.get('markets', []):
-                    if market['key'] == 'h2h':
-                        for outcome in market['outcomes']:
-                            price = outcome['price']
-                            if price <= 1.0 or price > 20.0:
-                                continue
-                            
-                            if outcome['name'] == game['home_team']:
-                                home_odds.append(price)
-                            elif outcome['name'] == game['away_team']:
-                                away_odds.append(price)
+            home_odds, away_odds = _extract_h2h_odds(bookmakers, home_team, away_team)
             
             if len(home_odds) < 3 or len(away_odds) < 3:
                 return None
             
+            # Record this scan's consensus and look up the oldest recent one
+            home_consensus = math.fsum(home_odds) / len(home_odds)
+            away_consensus = math.fsum(away_odds) / len(away_odds)
+            game_id = game.get('id')
+            if game_id and snapshots is not None:
+                snapshots[game_id] = (home_consensus, away_consensus)
+            previous = self.historical_odds.get(game_id)
+            
             # Calculate movement indicators
-            home_variance = statistics.variance(home_odds) if len(home_odds) > 1 else 0
-            away_variance = statistics.variance(away_odds) if len(away_odds) > 1 else 0
+            home_variance = sample_variance(home_odds) if len(home_odds) > 1 else 0
+            away_variance = sample_variance(away_odds) if len(away_odds) > 1 else 0
             
             # High variance suggests disagreement/movement
             max_variance = max(home_variance, away_variance)
@@ -77,14 +160,14 @@ class LiveOddsMonitor:
                 # Identify direction of movement
                 side = 'home' if home_variance > away_variance else 'away'
                 odds_list = home_odds if side == 'home' else away_odds
-                team = game['home_team'] if side == 'home' else game['away_team']
+                team = home_team if side == 'home' else away_team
                 
                 min_odds = min(odds_list)
                 max_odds = max(odds_list)
                 movement_range = (max_odds - min_odds) / min_odds
                 
-                return {
-                    'game': f"{game['home_team']} vs {game['away_team']}",
+                movement = {
+                    'game': f"{home_team} vs {away_team}",
                     'commence_time': game['commence_time'],
                     'movement_team': team,
                     'movement_side': side,
@@ -94,6 +177,15 @@ class LiveOddsMonitor:
                     'interpretation': self._interpret_movement(movement_range, max_variance),
                     'action_recommended': 'FOLLOW' if movement_range > 0.10 else 'MONITOR'
                 }
+                
+                # Consensus change on the moving side since the oldest stored snapshot
+                if previous:
+                    consensus, previous_consensus = (
+                        (home_consensus, previous[0]) if side == 'home' else (away_consensus, previous[1])
+                    )
+                    movement['consensus_shift'] = round((consensus - previous_consensus) / previous_consensus * 100, 2)
+                
+                return movement
             
             return None
             
@@ -123,7 +215,7 @@ class LiveOddsMonitor:
                 if value_analysis:
                     value_bets.append(value_analysis)
             
-            return sorted(value_bets, key=lambda x: x['value_percentage'], reverse=True)[:3]
+            return heapq.nlargest(3, value_bets, key=lambda x: x['value_percentage'])
             
         except Exception as e:
             logger.error(f"Error finding value bets: {e}")
@@ -136,22 +228,11 @@ class LiveOddsMonitor:
             if len(bookmakers) < 5:
                 return None
             
+            home_team = game['home_team']
+            away_team = game['away_team']
+            
             # Calculate fair odds using market consensus
-            home_odds = []
-            away_odds = []
-            
-            for bm in bookmakers:
-                for market in bm.get('markets', []):
-                    if market['key'] == 'h2h':
-                        for outcome in market['outcomes']:
-                            price = outcome['price']
-                            if price <= 1.0 or price > 20.0:
-                                continue
-                            
-                            if outcome['name'] == game['home_team']:
-                                home_odds.append(price)
-                            elif outcome['name'] == game['away_team']:
-                                away_odds.append(price)
+            home_odds, away_odds = _extract_h2h_odds(bookmakers, home_team, away_team)
             
             if len(home_odds) < 3 or len(away_odds) < 3:
                 return None
@@ -160,8 +241,8 @@ class LiveOddsMonitor:
             home_probs = [1/odds for odds in home_odds]
             away_probs = [1/odds for odds in away_odds]
             
-            fair_home_prob = statistics.mean(home_probs)
-            fair_away_prob = statistics.mean(away_probs)
+            fair_home_prob = math.fsum(home_probs) / len(home_probs)
+            fair_away_prob = math.fsum(away_probs) / len(away_probs)
             
             # Normalize probabilities
             total_prob = fair_home_prob + fair_away_prob
@@ -172,9 +253,9 @@ class LiveOddsMonitor:
             best_home_odds = max(home_odds)
             best_away_odds = max(away_odds)
             
-            # Calculate implied probabilities from best odds
-            best_home_implied = 1 / best_home_odds
-            best_away_implied = 1 / best_away_odds
+            # Implied probabilities of the best odds are the smallest reciprocals
+            best_home_implied = min(home_probs)
+            best_away_implied = min(away_probs)
             
             # Calculate value
             home_value = (fair_home_prob - best_home_implied) / best_home_implied
@@ -184,9 +265,9 @@ class LiveOddsMonitor:
             if home_value > 0.05 or away_value > 0.05:  # 5% minimum value
                 if home_value > away_value:
                     return {
-                        'game': f"{game['home_team']} vs {game['away_team']}",
+                        'game': f"{home_team} vs {away_team}",
                         'commence_time': game['commence_time'],
-                        'value_team': game['home_team'],
+                        'value_team': home_team,
                         'value_side': 'home',
                         'fair_probability': round(fair_home_prob * 100, 1),
                         'market_probability': round(best_home_implied * 100, 1),
@@ -197,9 +278,9 @@ class LiveOddsMonitor:
                     }
                 elif away_value > 0.05:
                     return {
-                        'game': f"{game['home_team']} vs {game['away_team']}",
+                        'game': f"{home_team} vs {away_team}",
                         'commence_time': game['commence_time'],
-                        'value_team': game['away_team'],
+                        'value_team': away_team,
                         'value_side': 'away',
                         'fair_probability': round(fair_away_prob * 100, 1),
                         'market_probability': round(best_away_implied * 100, 1),
@@ -222,40 +303,42 @@ class LiveOddsMonitor:
             line_movements = self.detect_significant_line_movement(sport_key)
             value_opportunities = self.find_value_betting_opportunities(sport_key)
             
-            report = f"📊 LIVE ODDS MONITORING - {sport_key.upper()}\n\n"
+            parts = [f"📊 LIVE ODDS MONITORING - {sport_key.upper()}\n\n"]
             
             # Line Movement Section
             if line_movements:
-                report += "🔥 SIGNIFICANT LINE MOVEMENTS:\n"
+                parts.append("🔥 SIGNIFICANT LINE MOVEMENTS:\n")
                 for i, movement in enumerate(line_movements, 1):
-                    report += f"{i}. {movement['game']}\n"
-                    report += f"   🎯 {movement['movement_team']} - Movement: {movement['movement_percentage']}%\n"
-                    report += f"   📈 Odds Range: {movement['odds_range']}\n"
-                    report += f"   💡 {movement['interpretation']}\n"
-                    report += f"   ⚡ Action: {movement['action_recommended']}\n\n"
+                    parts.append(f"{i}. {movement['game']}\n")
+                    parts.append(f"   🎯 {movement['movement_team']} - Movement: {movement['movement_percentage']}%\n")
+                    parts.append(f"   📈 Odds Range: {movement['odds_range']}\n")
+                    if 'consensus_shift' in movement:
+                        parts.append(f"   ⏱️ Consensus Shift (last hour): {movement['consensus_shift']:+.2f}%\n")
+                    parts.append(f"   💡 {movement['interpretation']}\n")
+                    parts.append(f"   ⚡ Action: {movement['action_recommended']}\n\n")
             else:
-                report += "🔥 SIGNIFICANT LINE MOVEMENTS: None detected\n\n"
+                parts.append("🔥 SIGNIFICANT LINE MOVEMENTS: None detected\n\n")
             
             # Value Betting Section
             if value_opportunities:
-                report += "💎 VALUE BETTING OPPORTUNITIES:\n"
+                parts.append("💎 VALUE BETTING OPPORTUNITIES:\n")
                 for i, value in enumerate(value_opportunities, 1):
-                    report += f"{i}. {value['game']}\n"
-                    report += f"   🎯 {value['value_team']} @ {value['best_odds']}\n"
-                    report += f"   📊 Fair: {value['fair_probability']}% | Market: {value['market_probability']}%\n"
-                    report += f"   💰 Edge: {value['value_percentage']}% value\n"
-                    report += f"   ⚡ Confidence: {value['confidence']}\n\n"
+                    parts.append(f"{i}. {value['game']}\n")
+                    parts.append(f"   🎯 {value['value_team']} @ {value['best_odds']}\n")
+                    parts.append(f"   📊 Fair: {value['fair_probability']}% | Market: {value['market_probability']}%\n")
+                    parts.append(f"   💰 Edge: {value['value_percentage']}% value\n")
+                    parts.append(f"   ⚡ Confidence: {value['confidence']}\n\n")
             else:
-                report += "💎 VALUE BETTING OPPORTUNITIES: None detected\n\n"
+                parts.append("💎 VALUE BETTING OPPORTUNITIES: None detected\n\n")
             
-            report += "🧠 MONITORING INSIGHTS:\n"
-            report += "• Line movements indicate where sharp money is going\n"
-            report += "• Value bets show market inefficiencies to exploit\n"
-            report += "• High confidence opportunities have strongest edge\n"
-            report += "• Follow significant movements quickly - windows close fast\n\n"
-            report += "⚠️ Monitor continuously - odds change rapidly!"
+            parts.append("🧠 MONITORING INSIGHTS:\n")
+            parts.append("• Line movements indicate where sharp money is going\n")
+            parts.append("• Value bets show market inefficiencies to exploit\n")
+            parts.append("• High confidence opportunities have strongest edge\n")
+            parts.append("• Follow significant movements quickly - windows close fast\n\n")
+            parts.append("⚠️ Monitor continuously - odds change rapidly!")
             
-            return report
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Error generating monitoring report: {e}")
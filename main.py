@@ -5,65 +5,177 @@ Clean version with minimal dependencies for successful Heroku deployment
 """
 
 import os
+import sys
+import asyncio
 import logging
-from telegram import Update
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters
-from bot_handlers import BotHandlers
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from telegram import Message, MessageEntity, Update
+from telegram.constants import ChatType
+from telegram.ext import AIORateLimiter, Application, ApplicationHandlerStop, CommandHandler, ContextTypes, TypeHandler
+from telegram.request import HTTPXRequest
+from bot_singletons import close_session, get_handlers, shutdown_engine_executor
 
 # Configure logging
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
+    level=os.getenv('LOG_LEVEL', 'INFO').upper()
 )
 logger = logging.getLogger(__name__)
 
+# Updates processed at once; handlers mostly wait on the odds API
+MAX_CONCURRENT_UPDATES = 32
+
+@dataclass(frozen=True)
+class BotEnvironment:
+    """Deployment settings read once from the environment at startup"""
+    token: str
+    app_name: Optional[str]
+    use_webhook: bool
+    port: int
+
+def read_environment() -> BotEnvironment:
+    """Snapshot the environment variables the bot depends on"""
+    return BotEnvironment(
+        token=os.getenv('TELEGRAM_BOT_TOKEN') or os.getenv('TELEGRAM_TOKEN') or "",
+        app_name=os.getenv('HEROKU_APP_NAME'),
+        # Only a web dyno receives HTTP traffic; the Procfile's worker must poll
+        use_webhook=os.getenv('USE_WEBHOOK', '').lower() in ('1', 'true', 'yes'),
+        port=int(os.getenv('PORT', 8443))
+    )
+
+# Bot commands and the BotHandlers method that serves each one
+COMMANDS = (
+    ("start", "start_command"),
+    ("help", "help_command"),
+    ("predictions", "predictions_command"),
+    ("arbitrage", "arbitrage_command"),
+    ("bankroll", "bankroll_command"),
+    ("steam", "steam_command"),
+    ("picks", "picks_command"),
+    ("odds", "odds_command"),
+    ("insider", "insider_command"),
+    ("edges", "edges_command"),
+    ("fifa", "fifa_command"),
+    ("risk", "risk_command"),
+    ("patterns", "patterns_command"),
+    ("scan", "scan_command"),
+    ("scores", "scores_command"),
+)
+
+_KNOWN_COMMANDS = frozenset(command for command, _ in COMMANDS)
+_UNKNOWN_COMMAND_TEXT = "❓ Unknown command. Use /help to see available commands."
+
+def _parse_command(message: Message) -> Optional[Tuple[str, str]]:
+    """(command, bot username) of a message starting with a bot command entity"""
+    for entity, text in message.parse_entities([MessageEntity.BOT_COMMAND]).items():
+        if entity.offset == 0:
+            command, _, username = text[1:].partition('@')
+            return command.lower(), username.lower()
+    return None
+
+async def reject_unknown_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Answer unknown /commands in private chats before any CommandHandler is consulted"""
+    message = update.effective_message
+    if not message or not message.entities:
+        return
+    
+    # Group members may be talking to other bots, so groups get no reply
+    if message.chat.type != ChatType.PRIVATE:
+        return
+    
+    parsed = _parse_command(message)
+    if parsed is None:
+        return
+    
+    command, username = parsed
+    if username and username != (context.bot.username or '').lower():
+        return  # /command@SomeOtherBot
+    
+    if command not in _KNOWN_COMMANDS:
+        await context.bot.send_message(message.chat_id, _UNKNOWN_COMMAND_TEXT)
+        raise ApplicationHandlerStop
+
+async def register_handlers(application: Application):
+    """Build the bot handlers off the event loop and register them"""
+    handlers = await asyncio.to_thread(get_handlers)
+    
+    # Unknown commands in private chats are answered once, ahead of the command handlers
+    application.add_handler(TypeHandler(Update, reject_unknown_command), group=-1)
+    
+    # One CommandHandler for every command, routed to the bound method by name
+    routes = {command: getattr(handlers, method) for command, method in COMMANDS}
+    
+    async def dispatch_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        command, _ = _parse_command(update.effective_message)
+        await routes[command](update, context)
+    
+    application.add_handler(CommandHandler(list(routes), dispatch_command))
+    
+    # Add error handler
+    application.add_error_handler(handlers.error_handler)
+
+async def release_resources(application: Application):
+    """Close pooled odds API connections and engine threads once the application has stopped"""
+    close_session()
+    shutdown_engine_executor()
+
+def run_application(application: Application, env: BotEnvironment):
+    """Receive updates by webhook when USE_WEBHOOK is set on Heroku, otherwise by polling"""
+    if env.use_webhook and env.app_name:
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=env.port,
+            url_path=env.token,
+            webhook_url=f"https://{env.app_name}.herokuapp.com/{env.token}",
+            drop_pending_updates=False
+        )
+    else:
+        # Long-poll for Telegram's maximum so an idle bot makes few getUpdates calls
+        application.run_polling(timeout=30, drop_pending_updates=False)
+
 def main():
     """Main function to run the bot"""
     try:
-        # Get bot token from environment
-        bot_token = os.getenv('TELEGRAM_BOT_TOKEN') or os.getenv('TELEGRAM_TOKEN')
+        env = read_environment()
         
-        if not bot_token:
+        if not env.token:
             logger.error("No bot token found in environment variables")
-            return
+            sys.exit(1)
         
-        logger.info("Starting Enhanced Sports Betting Predictions Bot...")
-        logger.info("Environment token check: Bot token configured")
+        # Faster event loop when available (Linux dynos)
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
         
         # Create application
-        application = Application.builder().token(bot_token).build()
-        
-        # Initialize bot handlers
-        handlers = BotHandlers()
-        logger.info("Bot handlers initialized successfully")
-        
-        # Add command handlers
-        application.add_handler(CommandHandler("start", handlers.start_command))
-        application.add_handler(CommandHandler("help", handlers.help_command))
-        application.add_handler(CommandHandler("predictions", handlers.predictions_command))
-        application.add_handler(CommandHandler("arbitrage", handlers.arbitrage_command))
-        application.add_handler(CommandHandler("bankroll", handlers.bankroll_command))
-        application.add_handler(CommandHandler("steam", handlers.steam_command))
-        application.add_handler(CommandHandler("picks", handlers.picks_command))
-        application.add_handler(CommandHandler("odds", handlers.odds_command))
-        application.add_handler(CommandHandler("insider", handlers.insider_command))
-        application.add_handler(CommandHandler("edges", handlers.edges_command))
-        application.add_handler(CommandHandler("fifa", handlers.fifa_command))
-        application.add_handler(CommandHandler("risk", handlers.risk_command))
-        application.add_handler(CommandHandler("patterns", handlers.patterns_command))
-        application.add_handler(CommandHandler("scan", handlers.scan_command))
-        application.add_handler(CommandHandler("scores", handlers.scores_command))
-        
-        # Add error handler
-        application.add_error_handler(handlers.error_handler)
+        application = (
+            Application.builder()
+            .token(env.token)
+            .concurrent_updates(MAX_CONCURRENT_UPDATES)
+            .rate_limiter(AIORateLimiter())
+            .request(HTTPXRequest(
+                connection_pool_size=MAX_CONCURRENT_UPDATES,
+                connect_timeout=5.0,
+                read_timeout=20.0,
+                pool_timeout=1.0
+            ))
+            .get_updates_request(HTTPXRequest(connection_pool_size=1))
+            .post_init(register_handlers)
+            .post_shutdown(release_resources)
+            .build()
+        )
         
-        logger.info("Bot is starting...")
+        mode = f"webhook on port {env.port}" if env.use_webhook and env.app_name else "polling"
+        logger.info(f"Starting Enhanced Sports Betting Predictions Bot: {mode}, {len(COMMANDS)} commands")
         
         # Run the bot
-        application.run_polling(drop_pending_updates=True)
+        run_application(application, env)
         
-    except Exception as e:
-        logger.error(f"Error starting bot: {e}")
+    except Exception:
+        logger.exception("Error starting bot")
         raise
 
 if __name__ == '__main__':
@@ -10,20 +10,38 @@ Professional cross-sport analysis system with:
 - Real-time advantage detection
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timezone
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from odds_service import OddsService
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from bot_singletons import get_engine_executor
+from odds_service import OddsService, index_markets
+from odds_math import sample_variance
 from advanced_prediction_engine import AdvancedPredictionEngine
 from live_arbitrage_scanner import LiveArbitrageScanner
 from winning_edge_calculator import WinningEdgeCalculator
 from insider_betting_intelligence import InsiderBettingIntelligence
-import statistics
 
 logger = logging.getLogger(__name__)
 
+# Strategy for correlation strengths 7 through 10
+_CORRELATION_STRATEGIES = ("VARIANCE_EXPLOIT", "CORRELATED_HEDGE", "MULTI_MARKET_ARBITRAGE", "MULTI_MARKET_ARBITRAGE")
+
+# Engine calls each sport scan submits to the shared engine pool
+_ENGINES_PER_SPORT = 5
+
+class WeightedOpportunity(NamedTuple):
+    opp: Dict
+    sport: str
+    category: str
+    sport_priority: int
+    composite_score: float
+
 class MultiSportScanner:
     def __init__(self):
         self.odds_service = OddsService()
@@ -44,43 +62,81 @@ class MultiSportScanner:
             'tennis_atp': {'priority': 6, 'min_bookmakers': 10, 'value_threshold': 4.0},
             'mma_mixed_martial_arts': {'priority': 5, 'min_bookmakers': 8, 'value_threshold': 5.0}
         }
+        
+        # Back-to-back callers (report, dashboard) share one scan for this long
+        self.scan_cache_ttl = 15
+        self._last_scan_ts = 0.0
+        self._last_scan_result = None
+        self._scan_lock = threading.Lock()
     
     def scan_all_sports(self) -> Dict[str, Dict]:
         """Scan all sports for opportunities - Bot handler method"""
         return self.scan_all_premium_sports()
     
     def scan_all_premium_sports(self) -> Dict[str, Dict]:
+        """Scan all premium sports, reusing a scan finished within scan_cache_ttl"""
+        with self._scan_lock:
+            if (self._last_scan_result is not None and
+                    time.monotonic() - self._last_scan_ts < self.scan_cache_ttl):
+                return self._last_scan_result
+            
+            results = self._scan_premium_sports()
+            self._last_scan_ts = time.monotonic()
+            self._last_scan_result = results
+            return results
+    
+    def _scan_premium_sports(self) -> Dict[str, Dict]:
         """Scan all premium sports simultaneously for maximum advantage detection"""
         try:
             all_results = {}
             
-            with ThreadPoolExecutor(max_workers=6) as executor:
+            # Fetch every sport's odds concurrently up front
+            games_by_sport = self.odds_service.get_odds_batch(list(self.premium_sports))
+            
+            # One worker per sport: every analysis is I/O-bound. The executor is
+            # not a context manager so a timed-out scan does not wait on stragglers.
+            executor = ThreadPoolExecutor(max_workers=len(self.premium_sports), thread_name_prefix="sport-scan")
+            try:
                 futures = {}
                 
                 for sport_key, config in self.premium_sports.items():
-                    future = executor.submit(self._comprehensive_sport_analysis, sport_key, config)
-                    futures[sport_key] = future
+                    future = executor.submit(
+                        self._comprehensive_sport_analysis, sport_key, config, games_by_sport.get(sport_key)
+                    )
+                    futures[future] = sport_key
                 
-                # Collect results
-                for sport_key, future in futures.items():
-                    try:
-                        result = future.result(timeout=30)
-                        if result and result.get('total_opportunities', 0) > 0:
-                            all_results[sport_key] = result
-                    except Exception as e:
-                        logger.error(f"Error analyzing {sport_key}: {e}")
-                        continue
-            
-            return all_results
+                # Collect results as each sport finishes
+                try:
+                    for future in as_completed(futures, timeout=45):
+                        sport_key = futures[future]
+                        try:
+                            result = future.result()
+                            if result and result.get('total_opportunities', 0) > 0:
+                                all_results[sport_key] = result
+                        except Exception as e:
+                            logger.error(f"Error analyzing {sport_key}: {e}")
+                            continue
+                    executor.shutdown(wait=True)
+                except FuturesTimeoutError:
+                    pending = [futures[f] for f in futures if not f.done()]
+                    logger.warning(f"Premium scan timed out waiting for: {', '.join(pending)}")
+            finally:
+                # Only the normal path above waits; a timeout or any other error
+                # abandons the remaining sports without blocking (a no-op after wait=True)
+                executor.shutdown(wait=False, cancel_futures=True)
+            
+            # Keep the configured sport order regardless of completion order
+            return {sport_key: all_results[sport_key] for sport_key in self.premium_sports if sport_key in all_results}
             
         except Exception as e:
             logger.error(f"Error scanning all premium sports: {e}")
             return {}
     
-    def _comprehensive_sport_analysis(self, sport_key: str, config: Dict) -> Optional[Dict]:
+    def _comprehensive_sport_analysis(self, sport_key: str, config: Dict, games: Optional[List[Dict]] = None) -> Optional[Dict]:
         """Perform comprehensive analysis on a single sport"""
         try:
-            games = self.odds_service.get_odds(sport_key)
+            if games is None:
+                games = self.odds_service.get_odds(sport_key)
             if not games or len(games) == 0:
                 return None
             
@@ -106,9 +162,19 @@ class MultiSportScanner:
                 'cross_market_correlations': []
             }
             
+            # The five engines are independent, so run them side by side on the
+            # shared engine pool, which has a thread for every engine of every
+            # sport a premium scan runs at once
+            engine_executor = get_engine_executor(len(self.premium_sports) * _ENGINES_PER_SPORT)
+            predictions_future = engine_executor.submit(self.prediction_engine.generate_enhanced_predictions, sport_key)
+            arbitrage_future = engine_executor.submit(self.arbitrage_scanner.scan_live_arbitrage, sport_key)
+            edges_future = engine_executor.submit(self.edge_calculator.calculate_sport_edges, sport_key)
+            insider_future = engine_executor.submit(self.insider_intelligence.analyze_professional_patterns, sport_key)
+            correlations_future = engine_executor.submit(self._detect_cross_market_correlations, qualified_games)
+            
             # 1. Advanced Predictions
             try:
-                predictions = self.prediction_engine.generate_enhanced_predictions(sport_key)
+                predictions = predictions_future.result()
                 high_value_predictions = [
                     p for p in predictions 
                     if p.get('expected_value', 0) >= config['value_threshold']
@@ -120,7 +186,7 @@ class MultiSportScanner:
             
             # 2. Arbitrage Opportunities
             try:
-                arbitrage_ops = self.arbitrage_scanner.scan_live_arbitrage(sport_key)
+                arbitrage_ops = arbitrage_future.result()
                 analysis_results['arbitrage'] = arbitrage_ops[:3]
                 analysis_results['total_opportunities'] += len(arbitrage_ops)
             except Exception as e:
@@ -128,7 +194,7 @@ class MultiSportScanner:
             
             # 3. Mathematical Edge Calculations
             try:
-                edge_ops = self.edge_calculator.calculate_sport_edges(sport_key)
+                edge_ops = edges_future.result()
                 high_edge_ops = [
                     op for op in edge_ops 
                     if op.get('profit_percentage', 0) >= config['value_threshold']
@@ -140,7 +206,7 @@ class MultiSportScanner:
             
             # 4. Insider Intelligence
             try:
-                insider_ops = self.insider_intelligence.analyze_professional_patterns(sport_key)
+                insider_ops = insider_future.result()
                 high_confidence_ops = [
                     op for op in insider_ops 
                     if op.get('confidence_level', 0) >= 8
@@ -152,7 +218,7 @@ class MultiSportScanner:
             
             # 5. Cross-Market Correlation Analysis
             try:
-                correlations = self._detect_cross_market_correlations(qualified_games)
+                correlations = correlations_future.result()
                 analysis_results['cross_market_correlations'] = correlations[:2]
                 analysis_results['total_opportunities'] += len(correlations)
             except Exception as e:
@@ -194,30 +260,28 @@ class MultiSportScanner:
             h2h_odds = {'home': [], 'away': []}
             totals_odds = {'over': [], 'under': []}
             
-            for bm in bookmakers:
-                for market in bm.get('markets', []):
-                    if market['key'] == 'h2h':
-                        for outcome in market['outcomes']:
-                            if outcome['name'] == home_team:
-                                h2h_odds['home'].append(outcome['price'])
-                            elif outcome['name'] == away_team:
-                                h2h_odds['away'].append(outcome['price'])
-                    elif market['key'] == 'totals':
-                        for outcome in market['outcomes']:
-                            if outcome['name'] == 'Over':
-                                totals_odds['over'].append(outcome['price'])
-                            elif outcome['name'] == 'Under':
-                                totals_odds['under'].append(outcome['price'])
+            # Outcome name -> price list for each market we read; home wins a name clash
+            price_lists = {
+                'h2h': {away_team: h2h_odds['away'], home_team: h2h_odds['home']},
+                'totals': {'Over': totals_odds['over'], 'Under': totals_odds['under']}
+            }
+            markets = index_markets(game)
+            for market_key, lists_by_name in price_lists.items():
+                for outcomes in markets.get(market_key, []):
+                    for outcome in outcomes:
+                        prices = lists_by_name.get(outcome['name'])
+                        if prices is not None:
+                            prices.append(outcome['price'])
             
             # Correlation analysis
             if (len(h2h_odds['home']) >= 5 and len(h2h_odds['away']) >= 5 and
                 len(totals_odds['over']) >= 5 and len(totals_odds['under']) >= 5):
                 
                 # Calculate variance and correlation patterns
-                home_variance = statistics.variance(h2h_odds['home'])
-                away_variance = statistics.variance(h2h_odds['away'])
-                over_variance = statistics.variance(totals_odds['over'])
-                under_variance = statistics.variance(totals_odds['under'])
+                home_variance = sample_variance(h2h_odds['home'])
+                away_variance = sample_variance(h2h_odds['away'])
+                over_variance = sample_variance(totals_odds['over'])
+                under_variance = sample_variance(totals_odds['under'])
                 
                 # Detect correlation strength
                 total_variance = home_variance + away_variance + over_variance + under_variance
@@ -243,12 +307,7 @@ class MultiSportScanner:
     
     def _generate_correlation_strategy(self, strength: int) -> str:
         """Generate correlation-based betting strategy"""
-        if strength >= 9:
-            return "MULTI_MARKET_ARBITRAGE"
-        elif strength >= 8:
-            return "CORRELATED_HEDGE"
-        else:
-            return "VARIANCE_EXPLOIT"
+        return _CORRELATION_STRATEGIES[min(max(strength, 7), 10) - 7]
     
     def get_priority_opportunities(self, results: Dict[str, Dict]) -> List[Dict]:
         """Get top priority opportunities across all sports"""
@@ -257,23 +316,24 @@ class MultiSportScanner:
             
             for sport_key, sport_data in results.items():
                 sport_priority = sport_data.get('priority', 5)
+                priority_weight = sport_priority / 10
                 
                 # Weight opportunities by sport priority
                 for category in ['predictions', 'arbitrage', 'edge_calculations', 'insider_intelligence']:
                     for opp in sport_data.get(category, []):
-                        weighted_opp = opp.copy()
-                        weighted_opp['sport'] = sport_key
-                        weighted_opp['category'] = category
-                        weighted_opp['sport_priority'] = sport_priority
-                        
                         # Calculate composite score
                         base_score = opp.get('expected_value', opp.get('profit_percentage', opp.get('confidence_level', 5)))
-                        weighted_opp['composite_score'] = base_score * (sport_priority / 10)
-                        
-                        all_opportunities.append(weighted_opp)
-            
-            # Sort by composite score
-            return sorted(all_opportunities, key=lambda x: x['composite_score'], reverse=True)[:10]
+                        all_opportunities.append(WeightedOpportunity(
+                            opp, sport_key, category, sport_priority, base_score * priority_weight
+                        ))
+            
+            # Top 10 by composite score; only these are copied with their metadata
+            top = heapq.nlargest(10, all_opportunities, key=attrgetter('composite_score'))
+            return [
+                {**w.opp, 'sport': w.sport, 'category': w.category,
+                 'sport_priority': w.sport_priority, 'composite_score': w.composite_score}
+                for w in top
+            ]
             
         except Exception as e:
             logger.error(f"Error getting priority opportunities: {e}")
@@ -291,63 +351,63 @@ class MultiSportScanner:
             if not results:
                 return "🔍 MULTI-SPORT SCANNER\n\n⚠️ No premium opportunities found across all sports"
             
-            report = "🏆 MULTI-SPORT ADVANTAGE SCANNER\n"
-            report += "═══════════════════════════════════════════\n\n"
+            parts = ["🏆 MULTI-SPORT ADVANTAGE SCANNER\n",
+                     "═══════════════════════════════════════════\n\n"]
             
             # Summary statistics
             total_sports = len(results)
             total_opportunities = sum(data.get('total_opportunities', 0) for data in results.values())
             total_games = sum(data.get('total_games', 0) for data in results.values())
             
-            report += f"📊 SCAN SUMMARY:\n"
-            report += f"• Sports analyzed: {total_sports}\n"
-            report += f"• Games processed: {total_games}\n"
-            report += f"• Total opportunities: {total_opportunities}\n\n"
+            parts.append(f"📊 SCAN SUMMARY:\n")
+            parts.append(f"• Sports analyzed: {total_sports}\n")
+            parts.append(f"• Games processed: {total_games}\n")
+            parts.append(f"• Total opportunities: {total_opportunities}\n\n")
             
             # Priority opportunities
             priority_ops = self.get_priority_opportunities(results)
             if priority_ops:
-                report += "🎯 TOP PRIORITY OPPORTUNITIES:\n"
+                parts.append("🎯 TOP PRIORITY OPPORTUNITIES:\n")
                 for i, opp in enumerate(priority_ops[:5], 1):
-                    report += f"{i}. {opp.get('game', 'Unknown Game')} ({opp['sport'].upper()})\n"
-                    report += f"   📈 Score: {opp['composite_score']:.1f} | Category: {opp['category'].upper()}\n"
+                    parts.append(f"{i}. {opp.get('game', 'Unknown Game')} ({opp['sport'].upper()})\n")
+                    parts.append(f"   📈 Score: {opp['composite_score']:.1f} | Category: {opp['category'].upper()}\n")
                     
                     if opp['category'] == 'arbitrage':
-                        report += f"   💰 Guaranteed Profit: {opp.get('profit_percentage', 0):.2f}%\n"
+                        parts.append(f"   💰 Guaranteed Profit: {opp.get('profit_percentage', 0):.2f}%\n")
                     elif opp['category'] == 'predictions':
-                        report += f"   🎲 Expected Value: {opp.get('expected_value', 0):.1f}%\n"
+                        parts.append(f"   🎲 Expected Value: {opp.get('expected_value', 0):.1f}%\n")
                     elif opp['category'] == 'edge_calculations':
-                        report += f"   🔢 Mathematical Edge: {opp.get('profit_percentage', 0):.2f}%\n"
+                        parts.append(f"   🔢 Mathematical Edge: {opp.get('profit_percentage', 0):.2f}%\n")
                     elif opp['category'] == 'insider_intelligence':
-                        report += f"   🎯 Confidence: {opp.get('confidence_level', 0)}/10\n"
+                        parts.append(f"   🎯 Confidence: {opp.get('confidence_level', 0)}/10\n")
                     
-                    report += "\n"
+                    parts.append("\n")
             
             # Sport-by-sport breakdown
-            report += "📋 SPORT-BY-SPORT BREAKDOWN:\n"
+            parts.append("📋 SPORT-BY-SPORT BREAKDOWN:\n")
             for sport_key, data in sorted(results.items(), key=lambda x: x[1]['priority'], reverse=True):
-                report += f"\n🏅 {sport_key.upper().replace('_', ' ')} (Priority: {data['priority']}/10)\n"
-                report += f"   Games: {data['total_games']} | Opportunities: {data['total_opportunities']}\n"
+                parts.append(f"\n🏅 {sport_key.upper().replace('_', ' ')} (Priority: {data['priority']}/10)\n")
+                parts.append(f"   Games: {data['total_games']} | Opportunities: {data['total_opportunities']}\n")
                 
                 if data.get('arbitrage'):
-                    report += f"   ⚡ Arbitrage: {len(data['arbitrage'])} opportunities\n"
+                    parts.append(f"   ⚡ Arbitrage: {len(data['arbitrage'])} opportunities\n")
                 if data.get('predictions'):
-                    report += f"   🎯 Predictions: {len(data['predictions'])} high-value\n"
+                    parts.append(f"   🎯 Predictions: {len(data['predictions'])} high-value\n")
                 if data.get('edge_calculations'):
-                    report += f"   🔢 Edge Calculations: {len(data['edge_calculations'])} profitable\n"
+                    parts.append(f"   🔢 Edge Calculations: {len(data['edge_calculations'])} profitable\n")
                 if data.get('insider_intelligence'):
-                    report += f"   🎪 Insider Intelligence: {len(data['insider_intelligence'])} signals\n"
+                    parts.append(f"   🎪 Insider Intelligence: {len(data['insider_intelligence'])} signals\n")
             
-            report += f"\n🚀 EXECUTION PRIORITY:\n"
-            report += "1. ARBITRAGE - Guaranteed profit, execute immediately\n"
-            report += "2. EDGE CALCULATIONS - Mathematical advantage\n"
-            report += "3. INSIDER INTELLIGENCE - Professional patterns\n"
-            report += "4. PREDICTIONS - High-value opportunities\n"
-            report += "5. CORRELATIONS - Advanced strategies\n\n"
+            parts.append(f"\n🚀 EXECUTION PRIORITY:\n")
+            parts.append("1. ARBITRAGE - Guaranteed profit, execute immediately\n")
+            parts.append("2. EDGE CALCULATIONS - Mathematical advantage\n")
+            parts.append("3. INSIDER INTELLIGENCE - Professional patterns\n")
+            parts.append("4. PREDICTIONS - High-value opportunities\n")
+            parts.append("5. CORRELATIONS - Advanced strategies\n\n")
             
-            report += "🎯 MULTI-SPORT ANALYSIS COMPLETE"
+            parts.append("🎯 MULTI-SPORT ANALYSIS COMPLETE")
             
-            return report
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Error generating master report: {e}")
@@ -0,0 +1,13 @@
+"""
+Float statistics shared by the odds analyzers
+"""
+
+import math
+from typing import List
+
+def sample_variance(values: List[float]) -> float:
+    """Sample variance (n - 1 denominator) in two float passes"""
+    # Unlike statistics.variance this does not work in exact fractions, so a
+    # value rounded to two decimals can move by 0.01 near a rounding boundary
+    mean = math.fsum(values) / len(values)
+    return math.fsum([(x - mean) ** 2 for x in values]) / (len(values) - 1)
@@ -1,28 +1,88 @@
-import requests
+import math
+import threading
 import time
-from typing import Dict, List, Optional
-from config import ODDS_API_KEY, ODDS_API_BASE_URL, SPORTS, MARKETS, API_CALL_DELAY
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from bot_singletons import get_session
+from config import ODDS_API_KEY, ODDS_API_BASE_URL, SPORTS, MARKETS, API_CALL_DELAY, ODDS_CACHE_TTL
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_SUPPORTED_SPORTS = frozenset(SPORTS)
+
+# Responses shared by every OddsService instance: (endpoint, params) -> (fetched at, data)
+_response_cache: Dict[Tuple, Tuple[float, object]] = {}
+_response_cache_lock = threading.Lock()
+
+# Shared by get_odds_batch callers; requests are I/O-bound and rate limited anyway
+_batch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="odds-batch")
+
+def index_markets(game: Dict) -> Dict[str, List[List[Dict]]]:
+    """Outcome lists of a game grouped by market key, built once per analysis"""
+    markets = {}
+    for bookmaker in game.get('bookmakers', []):
+        for market in bookmaker.get('markets', []):
+            markets.setdefault(market['key'], []).append(market['outcomes'])
+    return markets
+
+def _parse_commence_time(game: Dict) -> Optional[float]:
+    """Epoch seconds of a game's commence_time, or None if it is missing or malformed"""
+    try:
+        return datetime.fromisoformat(game['commence_time'].replace('Z', '+00:00')).timestamp()
+    except (KeyError, AttributeError, ValueError):
+        return None
+
 class OddsService:
     def __init__(self):
         self.api_key = ODDS_API_KEY
         self.base_url = ODDS_API_BASE_URL
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
+        self.cache_ttl = ODDS_CACHE_TTL
+        self.session = get_session()
     
     def _rate_limit(self):
         """Implement rate limiting to avoid API quota issues"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < API_CALL_DELAY:
-            time.sleep(API_CALL_DELAY - time_since_last_request)
-        self.last_request_time = time.time()
+        # Reserve the next request slot under the lock, then sleep outside it,
+        # so concurrent callers are spaced API_CALL_DELAY apart
+        with self._rate_limit_lock:
+            current_time = time.time()
+            wait = self.last_request_time + API_CALL_DELAY - current_time
+            self.last_request_time = current_time + max(wait, 0)
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _cache_key(self, endpoint: str, params: Optional[Dict]) -> Tuple:
+        """Cache key for an endpoint and its query parameters"""
+        return (endpoint, tuple(sorted(params.items())) if params else ())
+    
+    def _cached_response(self, key: Tuple):
+        """Return a cached response younger than cache_ttl, or None"""
+        with _response_cache_lock:
+            entry = _response_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.cache_ttl:
+            logger.debug(f"Odds API cache hit: {key[0]}")
+            return entry[1]
+        return None
+    
+    def _store_response(self, key: Tuple, data):
+        """Remember a successful response and drop expired ones"""
+        now = time.monotonic()
+        with _response_cache_lock:
+            for stale in [k for k, (fetched, _) in _response_cache.items() if now - fetched >= self.cache_ttl]:
+                del _response_cache[stale]
+            _response_cache[key] = (now, data)
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make API request with error handling"""
+        cache_key = self._cache_key(endpoint, params)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         self._rate_limit()
         
         url = f"{self.base_url}/{endpoint}"
@@ -30,59 +90,76 @@ class OddsService:
         if params:
             default_params.update(params)
         
+        # Deferred like the session itself, so importing this module stays cheap
+        from requests.exceptions import RequestException
+        
         try:
-            response = requests.get(url, params=default_params, timeout=10)
+            response = self.session.get(url, params=default_params, timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            data = response.json()
+        except RequestException as e:
             logger.error(f"API request failed: {e}")
             return None
+        
+        logger.debug(f"Odds API cache miss: {endpoint}")
+        self._store_response(cache_key, data)
+        return data
     
     def get_sports(self) -> List[Dict]:
         """Get list of available sports"""
         data = self._make_request("sports")
         if data:
             # Filter to only sports we support
-            return [sport for sport in data if sport['key'] in SPORTS.keys()]
+            return [sport for sport in data if sport['key'] in _SUPPORTED_SPORTS]
         return []
     
-    def get_odds(self, sport_key: str, market: str = 'h2h') -> Optional[List[Dict]]:
-        """Get odds for a specific sport and market"""
-        params = {
+    def _odds_params(self, sport_key: str, market: str) -> Dict:
+        """Query parameters for the per-sport odds endpoint"""
+        return {
             'sport': sport_key,
             'regions': 'us,eu',
             'markets': market,
             'oddsFormat': 'decimal',
             'dateFormat': 'iso'
         }
+    
+    def get_odds(self, sport_key: str, market: str = 'h2h') -> Optional[List[Dict]]:
+        """Get odds for a specific sport and market"""
+        params = self._odds_params(sport_key, market)
         
         data = self._make_request("sports/{}/odds".format(sport_key), params)
         return data if data else []
     
+    def get_odds_batch(self, sport_keys: List[str], market: str = 'h2h') -> Dict[str, List[Dict]]:
+        """Get odds for several sports, keyed by sport key"""
+        # The v4 odds endpoint is scoped to a single sport. The per-sport
+        # requests overlap on a small thread pool, and each still goes
+        # through get_odds and _make_request.
+        unique_keys = list(dict.fromkeys(sport_keys))
+        results = _batch_executor.map(lambda sport_key: self.get_odds(sport_key, market), unique_keys)
+        return dict(zip(unique_keys, results))
+    
     def get_upcoming_games(self, sport_key: str, limit: int = 5) -> List[Dict]:
         """Get upcoming and live games for a sport within next 48 hours"""
         odds_data = self.get_odds(sport_key)
         if not odds_data:
             return []
         
-        from datetime import datetime, timezone, timedelta
-        now = datetime.now(timezone.utc)
-        past_limit = now - timedelta(hours=3)  # Include games that started up to 3 hours ago (live)
-        future_limit = now + timedelta(hours=48)
+        now = time.time()
+        past_limit = now - 3 * 3600  # Include games that started up to 3 hours ago (live)
+        future_limit = now + 48 * 3600
         
-        # Filter games happening from 3 hours ago to 48 hours in future
+        # Filter games happening from 3 hours ago to 48 hours in future,
+        # parsing each commence time once
         relevant_games = []
         for game in odds_data:
-            try:
-                game_time = datetime.fromisoformat(game['commence_time'].replace('Z', '+00:00'))
-                if past_limit <= game_time <= future_limit:
-                    relevant_games.append(game)
-            except:
-                continue
+            game_time = _parse_commence_time(game)
+            if game_time is not None and past_limit <= game_time <= future_limit:
+                relevant_games.append((game_time, game))
         
         # Sort by commence time and limit results
-        sorted_games = sorted(relevant_games, key=lambda x: x.get('commence_time', ''))
-        return sorted_games[:limit]
+        relevant_games.sort(key=lambda entry: entry[0])
+        return [game for _, game in relevant_games[:limit]]
     
     def get_best_odds(self, sport_key: str) -> List[Dict]:
         """Get games with the best odds analysis"""
@@ -96,8 +173,8 @@ class OddsService:
             # Analyze odds from different bookmakers
             odds_analysis = self._analyze_game_odds(game)
             if odds_analysis:
-                game['odds_analysis'] = odds_analysis
-                best_odds_games.append(game)
+                # Annotate a copy: the game dict may be shared through the response cache
+                best_odds_games.append({**game, 'odds_analysis': odds_analysis})
         
         # Sort by confidence score
         best_odds_games.sort(key=lambda x: x['odds_analysis']['confidence'], reverse=True)
@@ -110,11 +187,7 @@ class OddsService:
             return None
         
         # Collect all odds for head-to-head market
-        h2h_odds = []
-        for bookmaker in bookmakers:
-            for market in bookmaker.get('markets', []):
-                if market['key'] == 'h2h':
-                    h2h_odds.append(market['outcomes'])
+        h2h_odds = index_markets(game).get('h2h')
         
         if not h2h_odds:
             return None
@@ -123,17 +196,13 @@ class OddsService:
         team_odds = {}
         for outcomes in h2h_odds:
             for outcome in outcomes:
-                team = outcome['name']
-                price = float(outcome['price'])
-                if team not in team_odds:
-                    team_odds[team] = []
-                team_odds[team].append(price)
+                team_odds.setdefault(outcome['name'], []).append(float(outcome['price']))
         
         # Calculate average odds and variance
         analysis = {}
         for team, odds_list in team_odds.items():
-            avg_odds = sum(odds_list) / len(odds_list)
-            variance = sum((x - avg_odds) ** 2 for x in odds_list) / len(odds_list)
+            avg_odds = math.fsum(odds_list) / len(odds_list)
+            variance = math.fsum([(x - avg_odds) ** 2 for x in odds_list]) / len(odds_list)
             analysis[team] = {
                 'avg_odds': round(avg_odds, 2),
                 'variance': round(variance, 4),
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the insider opportunity score and its early exit
+"""
+
+import insider_betting_intelligence
+from insider_betting_intelligence import InsiderBettingIntelligence, _score_opportunity
+
+BOOKMAKER_KEYS = ['pinnacle', 'betfair', 'draftkings', 'fanduel', 'betmgm',
+                  'book5', 'book6', 'book7', 'book8', 'book9']
+
+def _game(game_id, home_prices, away_prices):
+    """Odds API style game with one h2h market per bookmaker, starting well after today"""
+    return {
+        'id': game_id,
+        'home_team': 'Home',
+        'away_team': 'Away',
+        'commence_time': '2099-01-01T20:00:00Z',
+        'bookmakers': [
+            {'key': key, 'title': key.title(), 'last_update': '2026-10-16T12:00:00Z',
+             'markets': [{'key': 'h2h', 'outcomes': [
+                 {'name': 'Home', 'price': home},
+                 {'name': 'Away', 'price': away}
+             ]}]}
+            for key, home, away in zip(BOOKMAKER_KEYS, home_prices, away_prices)
+        ]
+    }
+
+# Sharp books price the home side at 3.5 and public books at 1.5, with both
+# sides split evenly between 1.5 and 3.5 (variance 1.0, spread 2.0)
+SHARP_GAME = _game('sharp', [3.5, 3.5, 1.5, 1.5, 1.5, 3.5, 3.5, 3.5, 1.5, 1.5],
+                   [1.5, 1.5, 3.5, 3.5, 3.5, 1.5, 1.5, 1.5, 3.5, 3.5])
+FLAT_GAME = _game('flat', [2.0] * 10, [1.9] * 10)
+
+def test_score_cutoff():
+    """The weighted score must reach the next whole point to clear the cutoff"""
+    assert insider_betting_intelligence.MIN_WEIGHTED_OPPORTUNITY_SCORE == 7100
+    
+    # 1800 + 3000 + 250 + 1035 + 1000 = 7085
+    assert _score_opportunity(1, 75, 10, 69, True) == 70
+    # 1800 + 3000 + 250 + 1050 + 1000 = 7100
+    assert _score_opportunity(1, 75, 10, 70, True) == 71
+    
+    assert _score_opportunity(None, 0, 0, 0, False) == 0
+    assert _score_opportunity(1, 100, 100, 100, True) == 100
+
+def test_sharp_game_scores_above_cutoff():
+    """A fixed payload gets the full pattern and movement score and is reported"""
+    intelligence = InsiderBettingIntelligence()
+    intelligence.odds_service.get_odds = lambda sport_key: [SHARP_GAME, FLAT_GAME]
+    
+    opportunities = intelligence.analyze_insider_opportunities('soccer_epl')
+    
+    assert len(opportunities) == 1
+    opportunity = opportunities[0]
+    assert opportunity['game'] == 'Home vs Away'
+    # efficiency 1: 1800, patterns 75: 3000, home advantage 15: 375, movement 100 + bonus: 2500
+    assert opportunity['opportunity_score'] == 76
+    assert opportunity['professional_patterns']['pattern_strength'] == 75
+    assert opportunity['line_movement']['movement_strength'] == 100
+    assert opportunity['recommendation'] == 'MODERATE_SHARP_ACTION'
+    assert opportunity['confidence_level'] == 'HIGH'
+
+def test_efficient_market_exits_before_pattern_scan(monkeypatch):
+    """A game that cannot clear the cutoff skips the pattern and movement analysis"""
+    intelligence = InsiderBettingIntelligence()
+    scanned = []
+    monkeypatch.setattr(intelligence, '_detect_professional_patterns',
+                        lambda tables, sport_key: scanned.append(tables) or {'pattern_strength': 0})
+    
+    tables = intelligence._extract_odds_tables(FLAT_GAME)
+    
+    assert intelligence._comprehensive_insider_analysis(FLAT_GAME, 'soccer_epl', tables) is None
+    assert scanned == []
+
+def test_analysis_cache_reuses_unchanged_games(monkeypatch):
+    """A second pass over the same odds does not analyze the games again"""
+    intelligence = InsiderBettingIntelligence()
+    intelligence.odds_service.get_odds = lambda sport_key: [SHARP_GAME]
+    
+    first = intelligence.analyze_insider_opportunities('soccer_epl')
+    monkeypatch.setattr(intelligence, '_comprehensive_insider_analysis',
+                        lambda game, sport_key, tables: 1 / 0)
+    
+    assert intelligence.analyze_insider_opportunities('soccer_epl') == first
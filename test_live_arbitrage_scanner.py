@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the live arbitrage kernels and scan cache
+"""
+
+import pytest
+
+from live_arbitrage_scanner import LiveArbitrageScanner, _three_way_arbitrage, _two_way_arbitrage
+
+def _game(game_id, prices, last_update='2026-10-16T12:00:00Z'):
+    """Odds API style game; prices maps bookmaker title to (home, away) h2h prices"""
+    return {
+        'id': game_id,
+        'home_team': 'Home',
+        'away_team': 'Away',
+        'commence_time': '2026-10-16T20:00:00Z',
+        'bookmakers': [
+            {'key': title.lower(), 'title': title, 'last_update': last_update,
+             'markets': [{'key': 'h2h', 'outcomes': [
+                 {'name': 'Home', 'price': home},
+                 {'name': 'Away', 'price': away}
+             ]}]}
+            for title, (home, away) in prices.items()
+        ]
+    }
+
+# Best prices 2.2 / 2.2 are spread across two books: 100 - 2 / 2.2 * 100 = 9.09% profit
+ARB_GAME = _game('arb', {'Pinnacle': (2.2, 1.6), 'Bet365': (1.6, 2.2),
+                         'FanDuel': (1.9, 1.9), 'Unibet': (1.8, 1.95)})
+NO_ARB_GAME = _game('no-arb', {'Pinnacle': (1.9, 1.9), 'Bet365': (1.95, 1.85),
+                               'FanDuel': (1.9, 1.9), 'Unibet': (1.85, 1.95)})
+
+def test_two_way_kernel():
+    """Even best prices split the stake evenly and return the same on either side"""
+    profit, home_stake, away_stake, home_return, away_return = _two_way_arbitrage(2.2, 2.2)
+    
+    assert profit == pytest.approx(100 / 11)
+    assert home_stake == pytest.approx(500)
+    assert away_stake == pytest.approx(500)
+    assert home_return == pytest.approx(1100)
+    assert away_return == pytest.approx(1100)
+    
+    # 1/3 + 1/1.5 = 1, so there is no edge and the stake is split 1:2
+    profit, home_stake, away_stake, home_return, away_return = _two_way_arbitrage(3.0, 1.5)
+    assert profit == pytest.approx(0)
+    assert home_stake == pytest.approx(1000 / 3)
+    assert home_return == pytest.approx(away_return)
+
+def test_three_way_kernel():
+    """Stakes are proportional to implied probability and returns are level"""
+    (profit, home_stake, away_stake, draw_stake,
+     home_return, away_return, draw_return) = _three_way_arbitrage(4.0, 2.0, 5.0)
+    
+    # 0.25 + 0.5 + 0.2 = 0.95 implied probability
+    assert profit == pytest.approx(5)
+    assert home_stake == pytest.approx(250 / 0.95)
+    assert away_stake == pytest.approx(500 / 0.95)
+    assert draw_stake == pytest.approx(200 / 0.95)
+    assert home_return == pytest.approx(1000 / 0.95)
+    assert away_return == pytest.approx(home_return)
+    assert draw_return == pytest.approx(home_return)
+
+def test_scan_reports_best_prices():
+    """The scan pairs the best price of each side and drops games without an edge"""
+    scanner = LiveArbitrageScanner()
+    
+    opportunities = scanner._scan_games('soccer_epl', [NO_ARB_GAME, ARB_GAME])
+    
+    assert len(opportunities) == 1
+    opportunity = opportunities[0]
+    assert opportunity['arbitrage_type'] == 'TWO_WAY'
+    assert opportunity['profit_percentage'] == 9.091
+    assert opportunity['guaranteed_profit'] == 100.0
+    allocation = opportunity['bet_allocation']
+    assert (allocation['home']['bookmaker'], allocation['home']['stake']) == ('Pinnacle', 500.0)
+    assert (allocation['away']['bookmaker'], allocation['away']['stake']) == ('Bet365', 500.0)
+
+def test_bookmaker_without_markets_is_skipped():
+    """One bookmaker entry without markets does not drop the rest of the game"""
+    game = _game('arb', {'Pinnacle': (2.2, 1.6), 'Bet365': (1.6, 2.2),
+                         'FanDuel': (1.9, 1.9), 'Unibet': (1.8, 1.95)})
+    game['bookmakers'].append({'key': 'betway', 'title': 'Betway'})
+    
+    assert LiveArbitrageScanner()._analyze_arbitrage_opportunity(game)['profit_percentage'] == 9.091
+
+def test_scan_cache(monkeypatch):
+    """Unchanged odds reuse the last scan until scan_cache_ttl; new odds are rescanned"""
+    scanner = LiveArbitrageScanner()
+    now = 1000.0
+    monkeypatch.setattr('live_arbitrage_scanner.time.monotonic', lambda: now)
+    
+    first = scanner._scan_games('soccer_epl', [ARB_GAME])
+    assert scanner._scan_games('soccer_epl', [ARB_GAME]) == first
+    assert (scanner.cache_hits, scanner.cache_misses) == (1, 1)
+    
+    # Callers get their own list, so changing one does not touch the cache
+    scanner._scan_games('soccer_epl', [ARB_GAME]).clear()
+    assert scanner._scan_games('soccer_epl', [ARB_GAME]) == first
+    
+    # A newer bookmaker update is a different slate
+    updated = _game('arb', {'Pinnacle': (2.2, 1.6), 'Bet365': (1.6, 2.2),
+                            'FanDuel': (1.9, 1.9), 'Unibet': (1.8, 1.95)},
+                    last_update='2026-10-16T12:01:00Z')
+    scanner._scan_games('soccer_epl', [updated])
+    assert scanner.cache_misses == 2
+    
+    now += scanner.scan_cache_ttl
+    scanner._scan_games('soccer_epl', [ARB_GAME])
+    assert scanner.cache_misses == 3
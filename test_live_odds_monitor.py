@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the live odds monitor's consensus history
+"""
+
+import live_odds_monitor
+from live_odds_monitor import LiveOddsMonitor
+
+def _game(home_prices, away_prices):
+    """Odds API style game with one h2h market per bookmaker"""
+    return {
+        'id': 'game-1',
+        'home_team': 'Home',
+        'away_team': 'Away',
+        'commence_time': '2026-10-16T20:00:00Z',
+        'bookmakers': [
+            {'key': f'book{i}', 'title': f'Book {i}', 'markets': [{'key': 'h2h', 'outcomes': [
+                {'name': 'Home', 'price': home},
+                {'name': 'Away', 'price': away}
+            ]}]}
+            for i, (home, away) in enumerate(zip(home_prices, away_prices))
+        ]
+    }
+
+def test_history_round_trip():
+    """Saved snapshots load back from the next bucket and expire after history_ttl"""
+    monitor = LiveOddsMonitor(history_db=':memory:')
+    now = 1_800_000_000 - 1_800_000_000 % monitor.history_bucket
+    
+    monitor._save_odds_history({'game-1': (2.1, 1.8)}, now)
+    
+    assert monitor._load_odds_history(now) == {}  # still the current bucket
+    assert monitor._load_odds_history(now + monitor.history_bucket) == {'game-1': (2.1, 1.8)}
+    assert monitor._load_odds_history(now + monitor.history_ttl + monitor.history_bucket) == {}
+
+def test_history_keeps_oldest_snapshot():
+    """The oldest snapshot in the window is the one movement is measured against"""
+    monitor = LiveOddsMonitor(history_db=':memory:')
+    now = 1_800_000_000 - 1_800_000_000 % monitor.history_bucket
+    
+    monitor._save_odds_history({'game-1': (2.0, 1.8)}, now)
+    monitor._save_odds_history({'game-1': (2.2, 1.7)}, now + monitor.history_bucket)
+    
+    assert monitor._load_odds_history(now + 2 * monitor.history_bucket) == {'game-1': (2.0, 1.8)}
+
+def test_consensus_shift(monkeypatch):
+    """A second scan reports the moving side's consensus change since the stored snapshot"""
+    monitor = LiveOddsMonitor(history_db=':memory:')
+    game = _game([2.0, 2.5, 3.0, 2.2], [1.8, 1.7, 1.6, 1.75])
+    monitor.odds_service.get_odds = lambda sport_key, market='h2h': [game]
+    
+    now = 1_800_000_000
+    monkeypatch.setattr(live_odds_monitor.time, 'time', lambda: now)
+    monitor._save_odds_history({'game-1': (2.0, 1.7)}, now - 2 * monitor.history_bucket)
+    
+    movements = monitor.detect_significant_line_movement('soccer_epl')
+    
+    assert len(movements) == 1
+    assert movements[0]['movement_side'] == 'home'
+    assert movements[0]['consensus_shift'] == round((2.425 - 2.0) / 2.0 * 100, 2)
+    
+    # This scan's consensus was stored in the current bucket
+    rows = monitor._history_conn.execute(
+        "SELECT home_price, away_price FROM odds_history WHERE ts = ?", (now - now % monitor.history_bucket,)
+    ).fetchall()
+    assert rows == [(2.425, 1.7125)]
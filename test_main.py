@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the bot's command routing
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from telegram import Chat, Message, MessageEntity, Update
+from telegram.constants import ChatType
+from telegram.ext import ApplicationHandlerStop, CommandHandler
+
+import main
+
+def _update(text, chat_type=ChatType.PRIVATE):
+    """Update carrying a message whose leading word is a bot command"""
+    command_length = len(text.split()[0])
+    message = Message(
+        message_id=1,
+        date=datetime(2026, 10, 16, tzinfo=timezone.utc),
+        chat=Chat(id=42, type=chat_type),
+        text=text,
+        entities=[MessageEntity(MessageEntity.BOT_COMMAND, 0, command_length)]
+    )
+    return Update(update_id=1, message=message)
+
+class FakeBot:
+    username = 'BettingBot'
+    
+    def __init__(self):
+        self.sent = []
+    
+    async def send_message(self, chat_id, text):
+        self.sent.append((chat_id, text))
+
+class FakeHandlers:
+    """Records which command method each update was routed to"""
+    def __init__(self):
+        self.calls = []
+        for _, method in main.COMMANDS:
+            setattr(self, method, self._recorder(method))
+    
+    def _recorder(self, method):
+        async def handle(update, context):
+            self.calls.append(method)
+        return handle
+    
+    async def error_handler(self, update, context):
+        pass
+
+class FakeApplication:
+    def __init__(self):
+        self.handlers = []
+        self.error_handlers = []
+    
+    def add_handler(self, handler, group=0):
+        self.handlers.append((group, handler))
+    
+    def add_error_handler(self, callback):
+        self.error_handlers.append(callback)
+
+def _reject(update):
+    """Run reject_unknown_command and return what it sent and whether it stopped the update"""
+    bot = FakeBot()
+    try:
+        asyncio.run(main.reject_unknown_command(update, SimpleNamespace(bot=bot)))
+    except ApplicationHandlerStop:
+        return bot.sent, True
+    return bot.sent, False
+
+def test_dispatch_command(monkeypatch):
+    """Every command is served by one CommandHandler routing to the method of the same name"""
+    handlers = FakeHandlers()
+    monkeypatch.setattr(main, 'get_handlers', lambda: handlers)
+    application = FakeApplication()
+    
+    asyncio.run(main.register_handlers(application))
+    
+    command_handlers = [handler for _, handler in application.handlers if isinstance(handler, CommandHandler)]
+    assert len(command_handlers) == 1
+    command_handler = command_handlers[0]
+    assert command_handler.commands == frozenset(command for command, _ in main.COMMANDS)
+    assert application.error_handlers == [handlers.error_handler]
+    
+    for text, method in [("/odds", "odds_command"), ("/Scan nba", "scan_command"),
+                         ("/insider@BettingBot", "insider_command")]:
+        asyncio.run(command_handler.callback(_update(text), SimpleNamespace()))
+        assert handlers.calls[-1] == method
+
+def test_unknown_command_in_private_chat():
+    """An unknown command in a private chat is answered once and stops further handlers"""
+    assert _reject(_update("/bogus")) == ([(42, main._UNKNOWN_COMMAND_TEXT)], True)
+    assert _reject(_update("/bogus@BettingBot")) == ([(42, main._UNKNOWN_COMMAND_TEXT)], True)
+
+@pytest.mark.parametrize("text, chat_type", [
+    ("/odds", ChatType.PRIVATE),  # known command
+    ("/bogus@OtherBot", ChatType.PRIVATE),  # addressed to another bot
+    ("/bogus", ChatType.GROUP),
+    ("/bogus", ChatType.SUPERGROUP),
+])
+def test_unknown_command_ignored(text, chat_type):
+    """Known commands, other bots' commands and group chats get no reply"""
+    assert _reject(_update(text, chat_type)) == ([], False)
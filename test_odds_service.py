@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the odds API response cache
+"""
+
+import pytest
+
+import odds_service
+from odds_service import OddsService
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+    
+    def raise_for_status(self):
+        pass
+    
+    def json(self):
+        return self.data
+
+class FakeSession:
+    """Records each GET and answers with the sport key it was asked for"""
+    def __init__(self):
+        self.calls = []
+    
+    def get(self, url, params=None, timeout=None):
+        self.calls.append((url, params))
+        return FakeResponse([{'id': params['sport'], 'bookmakers': []}])
+
+@pytest.fixture
+def service(monkeypatch):
+    """OddsService with a stubbed session, a clock under test control and no rate limit delay"""
+    monkeypatch.setattr(odds_service, '_response_cache', {})
+    monkeypatch.setattr(odds_service, 'API_CALL_DELAY', 0)
+    clock = [1000.0]
+    monkeypatch.setattr(odds_service.time, 'monotonic', lambda: clock[0])
+    
+    service = OddsService()
+    service.session = FakeSession()
+    service.clock = clock
+    return service
+
+def test_cache_hit(service):
+    """Identical requests within cache_ttl reach the API once and share the response"""
+    first = service.get_odds('soccer_epl')
+    
+    assert service.get_odds('soccer_epl') is first
+    assert len(service.session.calls) == 1
+    
+    # Another instance shares the module-level cache
+    other = OddsService()
+    other.session = FakeSession()
+    assert other.get_odds('soccer_epl') is first
+    assert other.session.calls == []
+    
+    # Different parameters are a different request
+    service.get_odds('soccer_epl', market='spreads')
+    assert len(service.session.calls) == 2
+
+def test_cache_expiry(service):
+    """A response is fetched again once it is cache_ttl old"""
+    service.get_odds('soccer_epl')
+    
+    service.clock[0] += service.cache_ttl - 1
+    service.get_odds('soccer_epl')
+    assert len(service.session.calls) == 1
+    
+    service.clock[0] += 1
+    service.get_odds('soccer_epl')
+    assert len(service.session.calls) == 2
+
+def test_store_evicts_expired_responses(service):
+    """Storing a response drops the expired ones, so the cache does not grow without bound"""
+    service.get_odds('soccer_epl')
+    service.clock[0] += service.cache_ttl
+    service.get_odds('basketball_nba')
+    
+    assert [key[0] for key in odds_service._response_cache] == ['sports/basketball_nba/odds']
+
+def test_failed_request_is_not_cached(service):
+    """A failed request is not cached, so the next call tries the API again"""
+    from requests.exceptions import ConnectionError
+    
+    def fail(url, params=None, timeout=None):
+        service.session.calls.append((url, params))
+        raise ConnectionError("connection refused")
+    
+    service.session.get = fail
+    assert service.get_odds('soccer_epl') == []
+    assert service.get_odds('soccer_epl') == []
+    assert len(service.session.calls) == 2
+    assert odds_service._response_cache == {}